@@ -0,0 +1,452 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+from scipy.interpolate import CubicSpline
+
+# === FUNKCJE POMOCNICZE ===
+
+def _value_columns(df, group, value):
+    if value is None:
+        return [c for c in df.select_dtypes(include=[np.number]).columns if c != group]
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+def group_statistics(df, group, value):
+    """
+    Liczność, średnia i wariancja (ddof=1) w grupach - jedna agregacja groupby
+
+    Returns:
+    --------
+    tuple : (n, mean, var) - ramki danych grupy × kolumny
+    """
+    agg = df.groupby(group, observed=True)[value].agg(['count', 'mean', 'var'])
+    n = agg.xs('count', axis=1, level=1)
+    mean = agg.xs('mean', axis=1, level=1)
+    var = agg.xs('var', axis=1, level=1).fillna(0.0)  # grupa jednoelementowa
+    return n, mean, var
+
+
+# === JEDNOCZYNNIKOWA ANOVA ===
+
+def oneway_anova(df, group, value=None):
+    """
+    Jednoczynnikowa analiza wariancji z sum kwadratów w grupach
+
+    Sumy kwadratów wyznaczane są ze statystyk dostatecznych grup
+    (liczność, średnia, wariancja) z jednej agregacji groupby - bez budowy
+    macierzy planu jak w `ols(...).fit()` + `anova_lm`. Można podać wiele
+    kolumn odpowiedzi naraz; braki danych są pomijane w każdej kolumnie.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dane w formacie długim
+    group : str
+        Kolumna z grupami (czynnik)
+    value : str lub list, optional
+        Kolumna (kolumny) odpowiedzi; domyślnie wszystkie liczbowe poza `group`
+
+    Returns:
+    --------
+    pd.DataFrame : jeden wiersz na kolumnę odpowiedzi - stopnie swobody,
+                   sumy i średnie kwadratów, F, p-value, eta² i omega²
+    """
+    value = _value_columns(df, group, value)
+    n, mean, var = group_statistics(df, group, value)
+
+    n_total = n.sum()
+    k = (n > 0).sum()
+    grand_mean = (n * mean).sum() / n_total
+
+    ss_between = (n * (mean - grand_mean) ** 2).sum()
+    ss_within = ((n - 1).clip(lower=0) * var).sum()
+    ss_total = ss_between + ss_within
+
+    df_between = k - 1
+    df_within = n_total - k
+    ms_between = ss_between / df_between
+    ms_within = ss_within / df_within
+    f_stat = ms_between / ms_within
+
+    result = pd.DataFrame({
+        'n': n_total,
+        'k': k,
+        'df_between': df_between,
+        'df_within': df_within,
+        'ss_between': ss_between,
+        'ss_within': ss_within,
+        'ms_between': ms_between,
+        'ms_within': ms_within,
+        'F': f_stat,
+        'p_value': stats.f.sf(f_stat, df_between, df_within),
+        'eta_sq': ss_between / ss_total,
+        'omega_sq': (ss_between - df_between * ms_within) / (ss_total + ms_within),
+    })
+    result.index.name = 'value'
+    return result
+
+
+# === PORÓWNANIA WIELOKROTNE (TUKEY HSD, GAMES-HOWELL) ===
+
+# Siatka wartości q, na której tablicowany jest ogon rozkładu rozstępu studentyzowanego;
+# powyżej niej (bardzo małe p-value, duże q krytyczne) liczone są wartości dokładne
+_Q_GRID = np.linspace(0.0, 15.0, 151)
+# Węzły stopni swobody (interpolacja liniowa w 1/df, jak w tablicach drukowanych)
+_DF_NODES = np.array([2, 3, 4, 5, 6, 8, 10, 12, 15, 20, 30, 40, 60, 120, 240, 1000, 10000], dtype=float)
+# Koszt wartości krytycznej (isf) w scipy, w przeliczeniu na wywołania sf
+_ISF_COST = 15
+
+# Tablice (k, df) -> funkcja sklejana log P(Q > q)
+_SRANGE_TABLES = {}
+
+
+def _srange_spline(k, df):
+    """
+    Funkcja sklejana log P(Q > q) dla rozkładu rozstępu studentyzowanego (k, df)
+
+    Całkowanie numeryczne w scipy jest kosztowne, więc tablica na siatce
+    `_Q_GRID` dla danej pary (k, df) liczona jest raz i trzymana w pamięci
+    podręcznej; wartości pośrednie daje interpolacja sklejana.
+    """
+    key = (k, float(df))
+    if key not in _SRANGE_TABLES:
+        sf = stats.studentized_range.sf(_Q_GRID, k, df)
+        sf = np.minimum.accumulate(np.clip(sf, 1e-300, 1.0))  # monotoniczność mimo błędów całkowania
+        _SRANGE_TABLES[key] = CubicSpline(_Q_GRID, np.log(sf))
+    return _SRANGE_TABLES[key]
+
+
+def _df_brackets(df):
+    """
+    Sąsiednie węzły `_DF_NODES` i waga interpolacji w 1/df
+    """
+    df = np.clip(df, _DF_NODES[0], _DF_NODES[-1])
+    idx = np.clip(np.searchsorted(_DF_NODES, df), 1, len(_DF_NODES) - 1)
+    lo, hi = _DF_NODES[idx - 1], _DF_NODES[idx]
+    return lo, hi, (1 / lo - 1 / df) / (1 / lo - 1 / hi)
+
+
+def _srange_tables_needed(k, df):
+    """
+    Pary (k, df) tablic, których brakuje w pamięci podręcznej do obsłużenia `df`
+    """
+    unique_df = np.unique(df)
+    if len(unique_df) == 1:
+        nodes = unique_df
+    else:
+        lo, hi, _ = _df_brackets(unique_df)
+        nodes = np.unique(np.concatenate([lo, hi]))
+    return [(k, float(node)) for node in nodes if (k, float(node)) not in _SRANGE_TABLES]
+
+
+def _srange_log_sf_exact(q, k, df):
+    with np.errstate(divide='ignore'):
+        return np.log(np.clip(stats.studentized_range.sf(q, k, df), 1e-300, 1.0))
+
+
+def _srange_log_sf(q, k, df):
+    """
+    log P(Q > q) wektorowo po parach; przy różnych df interpolacja w 1/df
+    między węzłami `_DF_NODES`, poza siatką q - wartość dokładna
+    """
+    q = np.maximum(np.asarray(q, dtype=float), 0.0)
+    df = np.broadcast_to(np.asarray(df, dtype=float), q.shape)
+    outside = q > _Q_GRID[-1]
+    qg = np.minimum(q, _Q_GRID[-1])
+    unique_df = np.unique(df)
+    if len(unique_df) == 1:
+        # Tukey HSD: jedna liczba stopni swobody - tablica dokładna
+        log_sf = _srange_spline(k, float(unique_df[0]))(qg)
+    else:
+        lo, hi, w = _df_brackets(df)
+        log_sf = np.zeros_like(q)
+        for node in np.unique(np.concatenate([lo, hi])):
+            spline = _srange_spline(k, float(node))
+            use_lo, use_hi = lo == node, hi == node
+            log_sf[use_lo] += (1 - w[use_lo]) * spline(qg[use_lo])
+            log_sf[use_hi] += w[use_hi] * spline(qg[use_hi])
+    if outside.any():
+        log_sf[outside] = _srange_log_sf_exact(q[outside], k, df[outside])
+    return np.minimum(log_sf, 0.0)
+
+
+def _srange_sf(q, k, df):
+    """
+    P(Q > q) z tablic w pamięci podręcznej
+    """
+    return np.exp(_srange_log_sf(q, k, df))
+
+
+def _srange_isf_exact(alpha, k, df):
+    """
+    Wartość krytyczna z scipy - jedno wywołanie na każdą różną liczbę df
+    """
+    unique_df, inverse = np.unique(df, return_inverse=True)
+    return np.array([stats.studentized_range.isf(alpha, k, d) for d in unique_df])[inverse.ravel()]
+
+
+def _srange_isf(alpha, k, df, n_iter=50):
+    """
+    Wartość krytyczna q_(1-alpha) - bisekcja wektorowa po tablicach w pamięci podręcznej
+
+    Gdy kwantyl leży powyżej siatki `_Q_GRID` (małe df, duże k), wartość
+    krytyczna liczona jest dokładnie przez scipy.
+    """
+    df = np.atleast_1d(np.asarray(df, dtype=float))
+    target = np.log(alpha)
+    beyond = _srange_log_sf(np.full_like(df, _Q_GRID[-1]), k, df) > target
+    lo = np.zeros_like(df)
+    hi = np.full_like(df, _Q_GRID[-1])
+    for _ in range(n_iter):
+        mid = (lo + hi) / 2
+        above = _srange_log_sf(mid, k, df) > target
+        lo = np.where(above, mid, lo)
+        hi = np.where(above, hi, mid)
+    q_crit = (lo + hi) / 2
+    if beyond.any():
+        q_crit[beyond] = _srange_isf_exact(alpha, k, df[beyond])
+    return q_crit
+
+
+def pairwise_comparisons(df, group, value, method='tukey', confidence_level=0.95):
+    """
+    Porównania wielokrotne średnich: Tukey HSD (Tukey-Kramer) lub Games-Howell
+
+    Różnice średnich dla wszystkich par grup liczone są przez broadcasting
+    wektora średnich grup, a p-value rozkładu rozstępu studentyzowanego
+    odczytywane z tablicy (k, df) trzymanej w pamięci podręcznej - pierwsze
+    wywołanie dla danego k buduje tablicę, kolejne trwają milisekundy.
+    W metodzie Games-Howella każda para ma inne df, więc p-value jest
+    interpolowane w 1/df między węzłami tablicy (błąd rzędu 1e-3). Gdy
+    par jest mało, a tablic brak, p-value i wartości krytyczne liczone są
+    dokładnie przez scipy - to szybsze niż budowa tablic.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dane w formacie długim
+    group : str
+        Kolumna z grupami
+    value : str
+        Kolumna odpowiedzi
+    method : str
+        'tukey' (równe wariancje) lub 'games-howell' (nierówne wariancje)
+    confidence_level : float
+        Poziom ufności przedziałów dla różnic
+
+    Returns:
+    --------
+    pd.DataFrame : jeden wiersz na parę grup - różnica średnich (group2 - group1),
+                   błąd standardowy, q, skorygowane p-value, przedział ufności
+                   i decyzja o odrzuceniu H0
+    """
+    n, mean, var = group_statistics(df, group, [value])
+    levels = mean.index.to_numpy()
+    n, mean, var = n[value].to_numpy(float), mean[value].to_numpy(), var[value].to_numpy()
+    k = len(levels)
+    alpha = 1 - confidence_level
+
+    i, j = np.triu_indices(k, 1)
+    diff = mean[j] - mean[i]
+
+    if method == 'tukey':
+        df_within = n.sum() - k
+        ms_within = ((n - 1) * var).sum() / df_within
+        se = np.sqrt(ms_within / 2 * (1 / n[i] + 1 / n[j]))
+        dof = np.full(len(i), float(df_within))
+    elif method == 'games-howell':
+        vn_i, vn_j = var[i] / n[i], var[j] / n[j]
+        se = np.sqrt((vn_i + vn_j) / 2)
+        dof = (vn_i + vn_j) ** 2 / (vn_i ** 2 / (n[i] - 1) + vn_j ** 2 / (n[j] - 1))
+    else:
+        raise ValueError("method musi być 'tukey' lub 'games-howell'")
+
+    q = np.abs(diff) / se
+    # Budowa brakujących tablic kosztuje len(_Q_GRID) wywołań sf na każdą;
+    # przy niewielu parach taniej policzyć wartości dokładne
+    exact_cost = len(q) + _ISF_COST * len(np.unique(dof))
+    if exact_cost < len(_Q_GRID) * len(_srange_tables_needed(k, dof)):
+        p_adj = np.exp(_srange_log_sf_exact(q, k, dof))
+        q_crit = _srange_isf_exact(alpha, k, dof)
+    else:
+        p_adj = _srange_sf(q, k, dof)
+        q_crit = _srange_isf(alpha, k, dof)
+
+    return pd.DataFrame({
+        'group1': levels[i],
+        'group2': levels[j],
+        'meandiff': diff,
+        'standard_error': se,
+        'df': dof,
+        'q': q,
+        'p_adj': p_adj,
+        'ci_lower': diff - q_crit * se,
+        'ci_upper': diff + q_crit * se,
+        'reject': p_adj < alpha,
+    })
+
+
+# === ANOVA Z POWTARZANYMI POMIARAMI I TEST FRIEDMANA ===
+
+def to_wide(data, subject=None, within=None, dv=None):
+    """
+    Zamienia dane długie na macierz badani × warunki (jeden pivot)
+
+    Jeśli `subject` nie jest podany, `data` traktowane jest jako gotowa
+    macierz szeroka. Badani z brakami danych są pomijani.
+
+    Returns:
+    --------
+    tuple : (macierz n × k, etykiety warunków)
+    """
+    if subject is not None:
+        wide = data.pivot_table(index=subject, columns=within, values=dv, aggfunc='mean', observed=True)
+    else:
+        wide = pd.DataFrame(data)
+    wide = wide.dropna()
+    return wide.to_numpy(dtype=float), list(wide.columns)
+
+
+def _orthonormal_contrasts(k):
+    """
+    Ortonormalne kontrasty Helmerta (k × (k-1))
+    """
+    c = np.zeros((k, k - 1))
+    for j in range(1, k):
+        c[:j, j - 1] = 1.0
+        c[j, j - 1] = -j
+        c[:, j - 1] /= np.sqrt(j * (j + 1))
+    return c
+
+
+def sphericity(y):
+    """
+    Test sferyczności Mauchly'ego oraz poprawki Greenhouse'a-Geissera i Huynha-Feldta
+
+    Parameters:
+    -----------
+    y : np.ndarray
+        Macierz badani × warunki (bez braków danych)
+
+    Returns:
+    --------
+    dict : W Mauchly'ego, chi², df, p-value, epsilon GG i HF
+    """
+    n, k = y.shape
+    p = k - 1
+    centered = y - y.mean(axis=0)
+    cov = centered.T @ centered / (n - 1)
+    c = _orthonormal_contrasts(k)
+    t = c.T @ cov @ c
+
+    eps_gg = np.trace(t) ** 2 / (p * np.trace(t @ t))
+    eps_hf = min(1.0, (n * p * eps_gg - 2) / (p * (n - 1 - p * eps_gg)))
+
+    if p == 1:
+        # Dla dwóch warunków sferyczność jest spełniona zawsze
+        w, chi2, df_chi2, p_value = 1.0, 0.0, 0, 1.0
+    else:
+        w = np.linalg.det(t) / (np.trace(t) / p) ** p
+        chi2 = -(n - 1 - (2 * p ** 2 + p + 2) / (6 * p)) * np.log(w)
+        df_chi2 = p * (p + 1) // 2 - 1
+        p_value = stats.chi2.sf(chi2, df_chi2)
+
+    return {
+        'mauchly_W': w,
+        'chi2': chi2,
+        'df': df_chi2,
+        'p_value': p_value,
+        'epsilon_gg': eps_gg,
+        'epsilon_hf': eps_hf,
+    }
+
+
+def rm_anova(data, subject=None, within=None, dv=None):
+    """
+    Jednoczynnikowa ANOVA z powtarzanymi pomiarami
+
+    Dane przestawiane są raz do macierzy badani × warunki, a wszystkie
+    sumy kwadratów liczone redukcjami NumPy (średnie wierszy i kolumn) -
+    bez modelu AnovaRM na danych długich.
+
+    Parameters:
+    -----------
+    data : pd.DataFrame lub array-like
+        Dane długie (wtedy podaj subject, within, dv) lub macierz szeroka
+    subject : str, optional
+        Kolumna z identyfikatorem badanego
+    within : str, optional
+        Kolumna z warunkiem (czynnik wewnątrzobiektowy)
+    dv : str, optional
+        Kolumna ze zmienną zależną
+
+    Returns:
+    --------
+    dict : sumy kwadratów, F, p-value (bez poprawki oraz z poprawkami
+           GG i HF), eta² cząstkowe i uogólnione, wynik testu Mauchly'ego
+    """
+    y, conditions = to_wide(data, subject, within, dv)
+    n, k = y.shape
+    grand = y.mean()
+
+    ss_cond = n * ((y.mean(axis=0) - grand) ** 2).sum()
+    ss_subj = k * ((y.mean(axis=1) - grand) ** 2).sum()
+    ss_total = ((y - grand) ** 2).sum()
+    ss_error = ss_total - ss_cond - ss_subj
+
+    df_cond = k - 1
+    df_error = (n - 1) * (k - 1)
+    f_stat = (ss_cond / df_cond) / (ss_error / df_error)
+    sph = sphericity(y)
+
+    return {
+        'n_subjects': n,
+        'conditions': conditions,
+        'ss_conditions': ss_cond,
+        'ss_subjects': ss_subj,
+        'ss_error': ss_error,
+        'df_conditions': df_cond,
+        'df_error': df_error,
+        'F': f_stat,
+        'p_value': stats.f.sf(f_stat, df_cond, df_error),
+        'p_value_gg': stats.f.sf(f_stat, df_cond * sph['epsilon_gg'], df_error * sph['epsilon_gg']),
+        'p_value_hf': stats.f.sf(f_stat, df_cond * sph['epsilon_hf'], df_error * sph['epsilon_hf']),
+        'eta_sq_partial': ss_cond / (ss_cond + ss_error),
+        'eta_sq_generalized': ss_cond / (ss_cond + ss_subj + ss_error),
+        'sphericity': sph,
+    }
+
+
+def friedman_test(data, subject=None, within=None, dv=None):
+    """
+    Test Friedmana z rangami w obrębie badanych i poprawką na remisy
+
+    Rangi wszystkich wierszy macierzy badani × warunki liczone są jednym
+    wywołaniem `rank_columns` (na transpozycji), a statystyka z sum rang
+    warunków.
+
+    Returns:
+    --------
+    dict : statystyka Q, df, p-value, W Kendalla i średnie rangi warunków
+    """
+    from funkcje_testy import rank_columns
+
+    y, conditions = to_wide(data, subject, within, dv)
+    n, k = y.shape
+    ranks, tie_term, _ = rank_columns(y.T)
+    rank_sums = ranks.sum(axis=1)
+
+    q = 12.0 / (n * k * (k + 1)) * (rank_sums ** 2).sum() - 3.0 * n * (k + 1)
+    q /= 1 - tie_term.sum() / (n * k * (k ** 2 - 1))
+
+    return {
+        'n_subjects': n,
+        'conditions': conditions,
+        'statistic': q,
+        'df': k - 1,
+        'p_value': stats.chi2.sf(q, k - 1),
+        'kendall_W': q / (n * (k - 1)),
+        'mean_ranks': dict(zip(conditions, rank_sums / n)),
+    }
@@ -0,0 +1,208 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+# === FUNKCJE POMOCNICZE ===
+
+_FREQS = {'Y': 'datetime64[Y]', 'M': 'datetime64[M]', 'W': None, 'D': 'datetime64[D]'}
+
+
+def _components(df, column):
+    """Kolumna składowej daty jako float (brak danych = NaN)"""
+    return pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float)
+
+
+# === BUDOWANIE DAT ===
+
+def assemble_dates(df, year='Year', month='Month', day=None):
+    """
+    Daty z kolumn składowych (rok, miesiąc, dzień) - arytmetyka na liczbach całkowitych
+
+    Zamiast sklejać tekst 'miesiąc-rok' w pętli po wierszach i parsować go
+    przez `pd.to_datetime`, numer miesiąca liczony jest wprost:
+    (rok - 1970) * 12 + (miesiąc - 1) to wartość typu datetime64[M], do
+    której dodawany jest dzień. Wiersze z brakiem którejś składowej dają NaT;
+    niecałkowite składowe i nieistniejące daty (np. 30 lutego) - ValueError,
+    jak w `pd.to_datetime`.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dane
+    year, month : str
+        Kolumny z rokiem i miesiącem (1-12)
+    day : str, optional
+        Kolumna z dniem miesiąca (domyślnie pierwszy dzień)
+
+    Returns:
+    --------
+    pd.Series : daty (datetime64) z indeksem `df`
+    """
+    y = _components(df, year)
+    m = _components(df, month)
+    d = _components(df, day) if day is not None else np.ones(len(df))
+    valid = ~(np.isnan(y) | np.isnan(m) | np.isnan(d))
+    if any((np.mod(c[valid], 1) != 0).any() for c in (y, m, d)):
+        raise ValueError("year, month i day muszą być liczbami całkowitymi")
+    if ((m[valid] < 1) | (m[valid] > 12)).any():
+        raise ValueError("month musi być liczbą z zakresu 1-12")
+
+    months = np.where(valid, (y - 1970) * 12 + (m - 1), 0).astype(np.int64)
+    days = np.where(valid, d - 1, 0).astype(np.int64)
+    month_start = months.astype('datetime64[M]')
+    # Długość miesiąca = różnica początków kolejnych miesięcy
+    month_days = ((month_start + 1).astype('datetime64[D]')
+                  - month_start.astype('datetime64[D]')).astype(np.int64)
+    bad = valid & ((days < 0) | (days >= month_days))
+    if bad.any():
+        i = np.flatnonzero(bad)[0]
+        raise ValueError(f"Nieistniejąca data: rok {y[i]:.0f}, miesiąc {m[i]:.0f}, dzień {d[i]:.0f}")
+    dates = month_start.astype('datetime64[ns]') + days.astype('timedelta64[D]')
+    dates[~valid] = np.datetime64('NaT')
+    return pd.Series(dates, index=df.index, name='date')
+
+
+def parse_dates(values, format=None):
+    """
+    Parsowanie dat tekstowych - każda unikalna wartość parsowana jest raz
+
+    W danych dziennych (np. dailyActivity_merged.csv) ta sama data
+    powtarza się dla wielu osób - kodowanie `pd.factorize` sprowadza
+    parsowanie do listy unikalnych napisów, a wynik rozkładany jest
+    indeksowaniem kodami.
+
+    Parameters:
+    -----------
+    values : pd.Series lub array-like
+        Daty jako tekst
+    format : str, optional
+        Format (np. '%m/%d/%Y'); bez niego pandas wnioskuje go z danych
+
+    Returns:
+    --------
+    pd.Series : daty (datetime64[ns])
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    codes, uniques = pd.factorize(series)
+    if len(uniques) == 0:
+        return pd.Series(pd.NaT, index=series.index, name=series.name, dtype='datetime64[ns]')
+    parsed = pd.to_datetime(pd.Series(uniques), format=format).to_numpy(dtype='datetime64[ns]')
+    dates = parsed[np.maximum(codes, 0)]
+    dates[codes < 0] = np.datetime64('NaT')
+    return pd.Series(dates, index=series.index, name=series.name)
+
+
+def period_start(dates, freq='M'):
+    """
+    Początek okresu ('Y', 'M', 'W' - tydzień od poniedziałku, 'D') dla każdej daty
+
+    Obcięcie daty to rzutowanie typu datetime64 na mniej dokładną
+    jednostkę - bez tworzenia obiektów Period.
+
+    Returns:
+    --------
+    pd.Series : początki okresów (datetime64)
+    """
+    if freq not in _FREQS:
+        raise ValueError("freq musi być 'Y', 'M', 'W' lub 'D'")
+    series = pd.Series(pd.to_datetime(dates))
+    values = series.to_numpy(dtype='datetime64[ns]')
+    if freq == 'W':
+        days = values.astype('datetime64[D]')
+        # 1970-01-01 to czwartek: (dni + 3) % 7 = numer dnia tygodnia od poniedziałku
+        weekday = (days.astype(np.int64) + 3) % 7
+        start = days - weekday.astype('timedelta64[D]')
+    else:
+        start = values.astype(_FREQS[freq])
+    start = start.astype('datetime64[ns]')
+    start[np.isnat(values)] = np.datetime64('NaT')
+    return pd.Series(start, index=series.index, name='period')
+
+
+# === PODSUMOWANIA OKRESÓW ===
+
+def period_summary(df, value, date=None, freq='M', by=None, confidence_level=0.95,
+                   year='Year', month='Month', day=None):
+    """
+    Średnia z przedziałem ufności dla każdego okresu (i grupy) naraz
+
+    Klucz okresu powstaje z kolumny dat (`date`) albo - gdy jej brak - z
+    kolumn składowych (`assemble_dates`). Liczności, średnie i sumy
+    kwadratów odchyleń wszystkich okresów i kolumn liczone są jednym
+    przebiegiem `grouped_moments`. Przedział ufności wyznaczany jest jak w
+    `estimate_mean`: rozkład t dla n < 30, normalny dla n >= 30.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dane
+    value : str lub list
+        Kolumny liczbowe do podsumowania
+    date : str, optional
+        Kolumna z datami (datetime lub tekst)
+    freq : str
+        Długość okresu: 'Y', 'M', 'W' lub 'D'
+    by : str lub list, optional
+        Dodatkowe kolumny grupujące (np. 'Reason', 'Id')
+    confidence_level : float
+        Poziom ufności
+    year, month, day : str
+        Kolumny składowych daty, używane gdy `date` nie jest podane
+
+    Returns:
+    --------
+    pd.DataFrame : jeden wiersz na (grupa, okres, kolumna) - sample_size,
+                   mean, std, standard_error, margin_error, ci_lower, ci_upper
+    """
+    from funkcje_opisowe import grouped_moments
+
+    columns = [value] if isinstance(value, str) else list(value)
+    keys = [] if by is None else ([by] if isinstance(by, str) else list(by))
+    if date is not None:
+        dates = df[date]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = parse_dates(dates)
+    else:
+        dates = assemble_dates(df, year, month, day)
+
+    period = period_start(dates, freq).to_numpy()
+    # Wiersze bez daty (NaT) nie należą do żadnego okresu
+    has_date = ~np.isnat(period)
+    data = df.loc[has_date, keys + columns].copy()
+    data['period'] = period[has_date]
+    m = grouped_moments(data, keys + ['period'], columns, quantiles=())
+
+    n = m['count'].to_numpy()
+    alpha = 1 - confidence_level
+    with np.errstate(divide='ignore', invalid='ignore'):
+        std = np.where(n < 2, np.nan, np.sqrt(m['M2'].to_numpy() / (n - 1)))
+        se = std / np.sqrt(n)
+        critical = np.where(n < 30, stats.t.ppf(1 - alpha / 2, np.maximum(n - 1, 1)),
+                            stats.norm.ppf(1 - alpha / 2))
+    margin = critical * se
+    mean = m['mean'].to_numpy()
+    return pd.DataFrame({
+        'sample_size': n.astype(np.int64),
+        'mean': mean,
+        'std': std,
+        'standard_error': se,
+        'margin_error': margin,
+        'ci_lower': mean - margin,
+        'ci_upper': mean + margin,
+    }, index=m.index)
+
+
+# === PRZYKŁAD UŻYCIA ===
+
+if __name__ == "__main__":
+    # Sprawdzenie: wiersz z brakiem składowej daty nie tworzy własnego okresu
+    df = pd.DataFrame({'Year': [2020, np.nan, 2020, 2021], 'Month': [1, 1, 1, 3],
+                       'v': [1.0, 100.0, 3.0, 5.0]})
+    summary = period_summary(df, 'v')
+    print("=== PODSUMOWANIE MIESIĘCY ===")
+    print(summary[['sample_size', 'mean', 'ci_lower', 'ci_upper']])
+    assert list(summary['sample_size']) == [2, 1]
+    assert list(summary['mean']) == [2.0, 5.0]
+
+    # Ten sam typ wyniku parse_dates z brakami i bez
+    assert parse_dates(['01/02/2020', None]).dtype == parse_dates([None, None]).dtype
@@ -0,0 +1,569 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# === KATALOGI ===
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+CACHE_DIR = os.path.join(DATA_DIR, '.cache')
+
+# Kolumna tekstowa staje się kategorią, jeśli ma mniej unikalnych wartości
+# niż ten ułamek liczby wierszy
+CATEGORY_MAX_RATIO = 0.5
+
+try:
+    import pyarrow  # noqa: F401
+    _COLUMNAR_FORMAT = 'parquet'
+except ImportError:
+    # Bez pyarrow zapisujemy pickle - też zachowuje typy kolumn
+    _COLUMNAR_FORMAT = 'pickle'
+
+
+# === FUNKCJE POMOCNICZE ===
+
+def _resolve_csv(name):
+    """
+    Zamienia nazwę zbioru ('housing', 'wrangling/adult', 'bank.csv')
+    na ścieżkę do pliku CSV w katalogu data/
+    """
+    if os.path.isabs(name) and os.path.exists(name):
+        return name
+    rel = name if name.endswith('.csv') else name + '.csv'
+    path = os.path.join(DATA_DIR, rel)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Nie znaleziono zbioru '{name}' ({path})")
+    return path
+
+
+def _file_hash(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _source_meta(csv_path):
+    st = os.stat(csv_path)
+    return {'mtime': st.st_mtime, 'size': st.st_size, 'sha256': _file_hash(csv_path)}
+
+
+def _is_fresh(meta, csv_path, meta_path, verify_hash=True):
+    """
+    Sprawdza, czy plik pochodny odpowiada bieżącej wersji CSV
+
+    Zgodne mtime i rozmiar wystarczą; przy zmienionym mtime porównywany
+    jest jeszcze skrót zawartości. Jeśli plik był tylko "dotknięty",
+    nowy mtime zapisywany jest w metadanych, by nie liczyć skrótu ponownie.
+    """
+    st = os.stat(csv_path)
+    if meta['mtime'] == st.st_mtime and meta['size'] == st.st_size:
+        return True
+    if verify_hash and meta['size'] == st.st_size and meta['sha256'] == _file_hash(csv_path):
+        meta['mtime'] = st.st_mtime
+        with open(meta_path, 'w') as f:
+            json.dump(meta, f, indent=2)
+        return True
+    return False
+
+
+def _replace_atomically(path, write):
+    """
+    Zapis przez plik tymczasowy w tym samym katalogu i `os.replace`
+
+    Proces, który ma stary plik zmapowany w pamięci, dalej czyta stary
+    i-węzeł - nie widzi pliku zapisanego do połowy.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _cache_stem(csv_path, read_csv_kwargs):
+    rel = os.path.relpath(csv_path, DATA_DIR).replace(os.sep, '__')
+    stem = os.path.splitext(rel)[0]
+    if read_csv_kwargs:
+        key = json.dumps(read_csv_kwargs, sort_keys=True, default=str)
+        stem += '-' + hashlib.sha256(key.encode()).hexdigest()[:8]
+    return os.path.join(CACHE_DIR, stem)
+
+
+def optimize_dtypes(df, category_max_ratio=CATEGORY_MAX_RATIO):
+    """
+    Zmniejsza zużycie pamięci przez ramkę danych
+
+    Kolumny tekstowe o małej liczbie unikalnych wartości zamieniane są
+    na `category`, a kolumny całkowite rzutowane na najmniejszy typ,
+    który mieści ich zakres. Kolumny zmiennoprzecinkowe pozostają float64,
+    żeby nie tracić precyzji w estymacji.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Ramka danych (modyfikowana jest kopia)
+    category_max_ratio : float
+        Maksymalny stosunek liczby unikalnych wartości do liczby wierszy
+
+    Returns:
+    --------
+    pd.DataFrame : ramka danych z dopasowanymi typami
+    """
+    df = df.copy()
+    n = max(len(df), 1)
+    for col in df.columns:
+        s = df[col]
+        if pd.api.types.is_integer_dtype(s) and not pd.api.types.is_bool_dtype(s):
+            df[col] = pd.to_numeric(s, downcast='integer')
+        elif pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s):
+            if s.nunique(dropna=True) / n <= category_max_ratio:
+                df[col] = s.astype('category')
+    return df
+
+
+# === CACHE KOLUMNOWY ===
+
+def load_dataset(name, refresh=False, verify_hash=True, **read_csv_kwargs):
+    """
+    Wczytuje zbiór z katalogu data/ przez kolumnowy cache
+
+    Przy pierwszym wywołaniu CSV jest parsowany, typy są optymalizowane
+    (`optimize_dtypes`) i wynik zapisywany do data/.cache/ (Parquet, a bez
+    pyarrow - pickle). Kolejne wywołania czytają już plik kolumnowy.
+    Cache jest unieważniany, gdy zmieni się czas modyfikacji lub rozmiar
+    pliku źródłowego - a przy `verify_hash=True` tylko wtedy, gdy zmieni
+    się także jego zawartość (SHA-256).
+
+    Parameters:
+    -----------
+    name : str
+        Nazwa zbioru względem data/, np. 'housing', 'wrangling/adult'
+    refresh : bool
+        Wymusza ponowne zbudowanie cache
+    verify_hash : bool
+        Czy przy zmianie mtime porównywać skrót zawartości
+    **read_csv_kwargs :
+        Dodatkowe argumenty dla `pd.read_csv` (są częścią klucza cache)
+
+    Returns:
+    --------
+    pd.DataFrame : wczytany zbiór danych
+    """
+    csv_path = _resolve_csv(name)
+    stem = _cache_stem(csv_path, read_csv_kwargs)
+    data_path = stem + ('.parquet' if _COLUMNAR_FORMAT == 'parquet' else '.pkl')
+    meta_path = stem + '.json'
+
+    meta = None
+    if not refresh and os.path.exists(data_path) and os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if meta.get('format') != _COLUMNAR_FORMAT or not _is_fresh(meta, csv_path, meta_path, verify_hash):
+            meta = None
+
+    if meta is not None:
+        if _COLUMNAR_FORMAT == 'parquet':
+            return pd.read_parquet(data_path)
+        return pd.read_pickle(data_path)
+
+    df = optimize_dtypes(pd.read_csv(csv_path, **read_csv_kwargs))
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    if _COLUMNAR_FORMAT == 'parquet':
+        df.to_parquet(data_path)
+    else:
+        df.to_pickle(data_path)
+    meta = {'source': os.path.relpath(csv_path, DATA_DIR), 'format': _COLUMNAR_FORMAT}
+    meta.update(_source_meta(csv_path))
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f, indent=2)
+    return df
+
+
+def clear_cache():
+    """
+    Usuwa cały katalog data/.cache/ (pliki kolumnowe i magazyny kolumn)
+    """
+    if os.path.isdir(CACHE_DIR):
+        shutil.rmtree(CACHE_DIR)
+
+
+# === MAGAZYN KOLUMN (MEMMAP) ===
+
+def build_column_store(name, columns=None, extend=False, **read_csv_kwargs):
+    """
+    Zapisuje kolumny liczbowe zbioru jako osobne pliki .npy
+
+    Każda kolumna trafia do data/.cache/<zbiór>.columns/<numer>.npy,
+    a plik manifest.json opisuje typy, długość i źródło. Pliki .npy
+    można potem otwierać przez `load_columns` jako mapowane w pamięci
+    (mmap), więc wiele procesów współdzieli jedną kopię w cache stron.
+    Pliki i manifest zapisywane są przez plik tymczasowy i `os.replace`,
+    więc przebudowa nie psuje tablic już otwartych w innych procesach.
+
+    Parameters:
+    -----------
+    name : str
+        Nazwa zbioru względem data/, np. 'housing'
+    columns : list, optional
+        Kolumny do zapisania (domyślnie wszystkie liczbowe i logiczne)
+    extend : bool
+        Czy dopisać kolumny do aktualnego magazynu (zachowując zapisane)
+        zamiast budować go od nowa
+    **read_csv_kwargs :
+        Dodatkowe argumenty dla `pd.read_csv`
+
+    Returns:
+    --------
+    str : ścieżka do katalogu magazynu kolumn
+    """
+    csv_path = _resolve_csv(name)
+    store_dir = _cache_stem(csv_path, read_csv_kwargs) + '.columns'
+    manifest_path = os.path.join(store_dir, 'manifest.json')
+    df = load_dataset(name, **read_csv_kwargs)
+
+    if columns is None:
+        columns = [c for c in df.columns
+                   if pd.api.types.is_numeric_dtype(df[c]) or pd.api.types.is_bool_dtype(df[c])]
+
+    manifest = None
+    if extend and os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if not _is_fresh(manifest, csv_path, manifest_path):
+            manifest = None
+    if manifest is None:
+        manifest = {'source': os.path.relpath(csv_path, DATA_DIR), 'n_rows': len(df), 'columns': {}}
+        manifest.update(_source_meta(csv_path))
+    columns = [c for c in columns if not (extend and c in manifest['columns'])]
+
+    os.makedirs(store_dir, exist_ok=True)
+    # Nowe kolumny dostają kolejne numery - pliki kolumn już zapisanych się nie zmieniają
+    start = len(manifest['columns']) if extend else 0
+    for i, col in enumerate(columns, start):
+        values = df[col].to_numpy()
+        if not (np.issubdtype(values.dtype, np.number) or values.dtype == bool):
+            raise ValueError(f"Kolumna '{col}' nie jest liczbowa")
+        fname = f'{i:03d}.npy'
+        _replace_atomically(os.path.join(store_dir, fname),
+                            lambda f, v=np.ascontiguousarray(values): np.save(f, v))
+        manifest['columns'][col] = {'file': fname, 'dtype': str(values.dtype)}
+
+    _replace_atomically(manifest_path, lambda f: f.write(json.dumps(manifest, indent=2).encode()))
+    return store_dir
+
+
+def load_columns(name, columns=None, verify_hash=True, **read_csv_kwargs):
+    """
+    Otwiera kolumny zbioru jako tablice mapowane w pamięci (tylko do odczytu)
+
+    Jeśli magazyn nie istnieje albo plik CSV się zmienił, jest budowany
+    od nowa przez `build_column_store` (ze wszystkimi kolumnami liczbowymi),
+    a brakujące w nim kolumny są dopisywane. Zwrócone tablice `np.memmap` można
+    przekazywać bezpośrednio do funkcji z funkcje_est - nie są kopiowane.
+
+    Parameters:
+    -----------
+    name : str
+        Nazwa zbioru względem data/, np. 'housing'
+    columns : list, optional
+        Kolumny do otwarcia (domyślnie wszystkie z manifestu)
+    verify_hash : bool
+        Czy przy zmianie mtime porównywać skrót zawartości
+
+    Returns:
+    --------
+    dict : {nazwa kolumny: np.memmap}
+    """
+    csv_path = _resolve_csv(name)
+    store_dir = _cache_stem(csv_path, read_csv_kwargs) + '.columns'
+    manifest_path = os.path.join(store_dir, 'manifest.json')
+
+    manifest = None
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if not _is_fresh(manifest, csv_path, manifest_path, verify_hash):
+            manifest = None
+
+    if manifest is None:
+        build_column_store(name, **read_csv_kwargs)
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    if columns is None:
+        columns = list(manifest['columns'])
+    missing = [c for c in columns if c not in manifest['columns']]
+    if missing:
+        # Magazyn zbudowany dla części kolumn - dopisujemy brakujące
+        build_column_store(name, columns=missing, extend=True, **read_csv_kwargs)
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    return {col: np.load(os.path.join(store_dir, manifest['columns'][col]['file']), mmap_mode='r')
+            for col in columns}
+
+
+# === STRUMIENIOWE ZLICZANIE PROPORCJI ===
+
+def stream_proportion(path, column, positive, chunksize=100_000, dropna=False,
+                      p0=None, alternative='two-sided', confidence_level=0.95,
+                      **read_csv_kwargs):
+    """
+    Zlicza sukcesy w jednej kolumnie dużego pliku CSV, czytając go porcjami
+
+    Wczytywana jest tylko wskazana kolumna (`usecols`) jako `category`,
+    a dopasowanie do zbioru `positive` odbywa się raz na kategorię
+    i jest mapowane na kody. W pamięci jest naraz tylko jedna porcja,
+    a wynik zależy jedynie od zliczeń (sukcesy, n).
+
+    Parameters:
+    -----------
+    path : str
+        Ścieżka do pliku CSV
+    column : str
+        Kolumna z odpowiedziami
+    positive : iterable
+        Wartości traktowane jako sukces
+    chunksize : int
+        Liczba wierszy w porcji
+    dropna : bool
+        Czy pomijać braki danych (domyślnie liczą się jako porażki)
+    p0 : float, optional
+        Jeśli podane - wykonywany jest test z dla proporcji
+    alternative : str
+        Hipoteza alternatywna testu z
+    confidence_level : float
+        Poziom ufności przedziału dla proporcji
+
+    Returns:
+    --------
+    dict : liczności ('successes', 'n', 'value_counts'), wynik
+           estimate_proportion_from_counts ('estimate') i ewentualnie
+           proportion_ztest ('test')
+    """
+    from funkcje_est import estimate_proportion_from_counts, proportion_ztest
+
+    positive = set(positive)
+    successes = 0
+    n = 0
+    counts = {}
+    n_missing = 0
+
+    reader = pd.read_csv(path, usecols=[column], dtype={column: 'category'},
+                         chunksize=chunksize, **read_csv_kwargs)
+    for chunk in reader:
+        col = chunk[column]
+        codes = col.cat.codes.to_numpy()
+        categories = col.cat.categories
+
+        # Liczności kodów; kod -1 (brak danych) przesuwamy na pozycję 0
+        code_counts = np.bincount(codes + 1, minlength=len(categories) + 1)
+        n_missing += int(code_counts[0])
+        for cat, cnt in zip(categories, code_counts[1:]):
+            if cnt:
+                counts[cat] = counts.get(cat, 0) + int(cnt)
+
+        hit = np.asarray(categories.isin(positive))
+        successes += int(code_counts[1:][hit].sum())
+        n += len(codes) if not dropna else len(codes) - int(code_counts[0])
+
+    value_counts = pd.Series(counts, dtype='int64').sort_values(ascending=False)
+    if n_missing:
+        value_counts[np.nan] = n_missing
+
+    result = {
+        'successes': successes,
+        'n': n,
+        'value_counts': value_counts,
+        'estimate': estimate_proportion_from_counts(successes, n, confidence_level),
+    }
+    if p0 is not None:
+        result['test'] = proportion_ztest(successes, n, p0, alternative)
+    return result
+
+
+# === LOKALNE LUSTRO ZBIORÓW ZDALNYCH ===
+
+REMOTE_DIR = os.path.join(DATA_DIR, 'remote')
+# Skróty SHA-256 kopii dołączonych do repozytorium - zapisywane tylko przez mirror_remote_datasets
+REMOTE_MANIFEST = os.path.join(REMOTE_DIR, 'manifest.json')
+# Pobrania w czasie pracy (poza repozytorium): <sha256><rozszerzenie> i indeks url -> sha256
+REMOTE_CACHE_DIR = os.path.join(CACHE_DIR, 'remote')
+REMOTE_CACHE_INDEX = os.path.join(REMOTE_CACHE_DIR, 'index.json')
+
+# Adresy używane w notatnikach -> kopia dołączona do repozytorium (względem data/remote/)
+REMOTE_DATASETS = {
+    'https://raw.githubusercontent.com/kflisikowski/ds/master/credits.csv': 'credits.csv',
+    'https://raw.githubusercontent.com/kflisikowski/ds/master/Arthritis.csv': 'Arthritis.csv',
+    'https://raw.githubusercontent.com/kflisikowski/ds/master/jobsatisfaction.csv': 'jobsatisfaction.csv',
+    'https://github.com/kflisikowski/ds/raw/master/selfesteem.csv': 'selfesteem.csv',
+    'https://github.com/kflisikowski/ms/blob/main/diet.csv?raw=true': 'diet.csv',
+    # Inny plik niż data/mtcars.csv (mpg standaryzowane) - osobna kopia
+    'https://raw.githubusercontent.com/selva86/datasets/master/mtcars.csv': 'selva86__mtcars.csv',
+}
+
+# Zbiory z Kaggle (kagglehub) -> katalog lokalny (względem data/)
+KAGGLE_DATASETS = {
+    'crawford/80-cereals': 'remote/kaggle/crawford__80-cereals',
+    'stackoverflow/stack-overflow-2023-developers-survey': 'remote/kaggle/stackoverflow__stack-overflow-2023-developers-survey',
+}
+
+
+def _read_manifest(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_manifest(path, manifest):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _replace_atomically(path, lambda f: f.write(json.dumps(manifest, indent=2, sort_keys=True).encode()))
+
+
+def _download(url):
+    """
+    Pobiera plik do pamięci podręcznej data/.cache/remote/ pod nazwą ze skrótu treści
+
+    Returns:
+    --------
+    tuple : (ścieżka, SHA-256)
+    """
+    from urllib.request import urlopen
+
+    os.makedirs(REMOTE_CACHE_DIR, exist_ok=True)
+    ext = os.path.splitext(url.split('?')[0])[1] or '.csv'
+    fd, tmp = tempfile.mkstemp(dir=REMOTE_CACHE_DIR, suffix='.part')
+    try:
+        with urlopen(url, timeout=60) as response, os.fdopen(fd, 'wb') as f:
+            shutil.copyfileobj(response, f)
+        digest = _file_hash(tmp)
+        path = os.path.join(REMOTE_CACHE_DIR, digest + ext)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return path, digest
+
+
+def resolve_dataset(url, refresh=False):
+    """
+    Zwraca lokalną ścieżkę do zbioru, który notatnik wczytuje z adresu URL
+
+    Kolejność szukania:
+
+    1. kopia dołączona do repozytorium, data/remote/<plik> z `REMOTE_DATASETS`
+       (także dodana ręcznie) - używana bez sieci; jeśli manifest
+       data/remote/manifest.json zna skrót tego adresu, musi się zgadzać,
+    2. wcześniejsze pobranie w data/.cache/remote/ - plik nazwany skrótem
+       SHA-256 treści, sprawdzany przy odczycie,
+    3. pobranie z sieci do data/.cache/remote/ (i sprawdzenie ze skrótem
+       z manifestu, jeśli jest).
+
+    W czasie pracy zapisywana jest tylko pamięć podręczna (poza kontrolą
+    wersji) - pliki śledzone przez git zmienia wyłącznie
+    `mirror_remote_datasets`.
+
+    Parameters:
+    -----------
+    url : str
+        Adres URL pliku CSV
+    refresh : bool
+        Pomija kopie lokalne i pobiera plik ponownie
+
+    Returns:
+    --------
+    str : ścieżka do lokalnej kopii (można ją podać do `pd.read_csv`)
+    """
+    expected = _read_manifest(REMOTE_MANIFEST).get(url, {}).get('sha256')
+
+    if not refresh and url in REMOTE_DATASETS:
+        vendored = os.path.join(REMOTE_DIR, REMOTE_DATASETS[url])
+        if os.path.exists(vendored) and (expected is None or _file_hash(vendored) == expected):
+            return vendored
+
+    index = _read_manifest(REMOTE_CACHE_INDEX)
+    if not refresh and url in index:
+        cached = os.path.join(REMOTE_CACHE_DIR, index[url]['file'])
+        digest = index[url]['sha256']
+        if (os.path.exists(cached) and expected in (None, digest)
+                and _file_hash(cached) == digest):
+            return cached
+
+    try:
+        path, digest = _download(url)
+    except OSError as e:
+        raise FileNotFoundError(
+            f"Brak lokalnej kopii {url} (data/remote/ lub data/.cache/remote/) "
+            f"i nie udało się go pobrać: {e}"
+        ) from e
+    if expected is not None and digest != expected:
+        raise ValueError(f"Treść {url} ma inny skrót SHA-256 ({digest}) niż zapisany w manifeście ({expected})")
+
+    index[url] = {'file': os.path.basename(path), 'sha256': digest}
+    _write_manifest(REMOTE_CACHE_INDEX, index)
+    return path
+
+
+def resolve_kaggle(handle):
+    """
+    Zwraca katalog z plikami zbioru z Kaggle, najpierw szukając go w data/
+
+    Jeśli katalog z `KAGGLE_DATASETS` istnieje i nie jest pusty, jest
+    używany bez łączenia się z Kaggle. W przeciwnym razie zbiór jest
+    pobierany przez `kagglehub.dataset_download`.
+
+    Parameters:
+    -----------
+    handle : str
+        Identyfikator zbioru, np. 'crawford/80-cereals'
+
+    Returns:
+    --------
+    str : ścieżka do katalogu z plikami zbioru
+    """
+    if handle in KAGGLE_DATASETS:
+        local = os.path.join(DATA_DIR, KAGGLE_DATASETS[handle])
+        if os.path.isdir(local) and os.listdir(local):
+            return local
+
+    import kagglehub
+    return kagglehub.dataset_download(handle)
+
+
+def mirror_remote_datasets(refresh=False):
+    """
+    Dołącza zbiory z `REMOTE_DATASETS` do repozytorium: data/remote/ i skróty w manifeście
+
+    Narzędzie dla opiekuna repozytorium (wymaga sieci, chyba że pliki
+    są już w pamięci podręcznej): każdy plik trafia do data/remote/,
+    a SHA-256 jego treści - do data/remote/manifest.json. Oba należy
+    potem zatwierdzić w git - notatniki działają wtedy offline.
+
+    Returns:
+    --------
+    dict : {url: ścieżka w data/remote/}
+    """
+    manifest = _read_manifest(REMOTE_MANIFEST)
+    result = {}
+    for url, name in REMOTE_DATASETS.items():
+        source = resolve_dataset(url, refresh=refresh)
+        target = os.path.join(REMOTE_DIR, name)
+        if os.path.abspath(source) != os.path.abspath(target):
+            os.makedirs(REMOTE_DIR, exist_ok=True)
+            shutil.copyfile(source, target)
+        manifest[url] = {'file': name, 'sha256': _file_hash(target)}
+        result[url] = target
+    _write_manifest(REMOTE_MANIFEST, manifest)
+    return result
@@ -21,7 +21,7 @@ def estimate_mean(data, confidence_level=0.95):
     --------
     dict : słownik z wynikami estymacji
     """
-    data = np.array(data)
+    data = np.asarray(data)  # bez kopii - działa też dla np.memmap
     n = len(data)
     mean = np.mean(data)
     std = np.std(data, ddof=1)  # próbkowe odchylenie standardowe
@@ -54,28 +54,67 @@ def estimate_mean(data, confidence_level=0.95):
         'distribution_used': distribution_used
     }
 
-def sample_size_for_mean(std, margin_error, confidence_level=0.95):
+def _plan_sample_size(variance, margin_error, confidence_level, population_size,
+                      design_effect, n):
+    """
+    Wspólny rachunek planowania próby dla średniej i proporcji (tablice rozgłaszane)
+
+    n0 = z² · wariancja · deff / E², z poprawką dla populacji skończonej
+    n = n0 · N / (n0 + N - 1). W trybie odwrotnym (podane n) zwraca
+    margines błędu E osiągalny przy tej liczności.
+    """
+    confidence_level = np.asarray(confidence_level, dtype=float)
+    z_critical = stats.norm.ppf(1 - (1 - confidence_level) / 2)
+    variance = np.asarray(variance, dtype=float) * np.asarray(design_effect, dtype=float)
+    N = np.inf if population_size is None else np.asarray(population_size, dtype=float)
+    scalar = all(np.ndim(a) == 0 for a in (variance, margin_error, confidence_level,
+                                         population_size, design_effect, n))
+
+    if n is not None:
+        n = np.asarray(n, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fpc = np.where(np.isinf(N), 1.0, (N - n) / (N - 1))
+        margin = z_critical * np.sqrt(variance / n * np.clip(fpc, 0, None))
+        return float(margin) if scalar else margin
+
+    if margin_error is None:
+        raise ValueError("Podaj margin_error (wielkość próby) albo n (osiągalny margines błędu)")
+    n0 = z_critical ** 2 * variance / np.asarray(margin_error, dtype=float) ** 2
+    with np.errstate(invalid='ignore'):
+        n_required = np.where(np.isinf(N), n0, n0 * N / (n0 + N - 1))
+    n_required = np.ceil(n_required).astype(int)
+    return int(n_required) if scalar else n_required
+
+def sample_size_for_mean(std, margin_error=None, confidence_level=0.95, population_size=None,
+                         design_effect=1.0, n=None):
     """
     Oblicza minimalną wielkość próby dla zadanego marginesu błędu średniej
     
+    Wszystkie argumenty liczbowe mogą być tablicami - są rozgłaszane jak
+    w NumPy, np. std[:, None, None], margin[None, :, None] i
+    poziomy[None, None, :] dają tablicę warstwa × margines × poziom.
+    
     Parameters:
     -----------
-    std : float
+    std : float lub array
         Odchylenie standardowe (próbkowe lub oszacowane)
-    margin_error : float
+    margin_error : float lub array
         Żądany margines błędu
-    confidence_level : float
+    confidence_level : float lub array
         Poziom ufności
+    population_size : float lub array, optional
+        Wielkość populacji N - poprawka dla populacji skończonej (domyślnie brak)
+    design_effect : float lub array
+        Efekt schematu losowania (deff), np. dla losowania grupowego
+    n : float lub array, optional
+        Tryb odwrotny: budżet próby - zwracany jest osiągalny margines błędu
     
     Returns:
     --------
-    int : minimalna wielkość próby
+    int / np.ndarray : minimalna wielkość próby (lub margines błędu w trybie odwrotnym)
     """
-    alpha = 1 - confidence_level
-    z_critical = stats.norm.ppf(1 - alpha/2)
-    
-    n = (z_critical * std / margin_error) ** 2
-    return int(np.ceil(n))
+    return _plan_sample_size(np.asarray(std, dtype=float) ** 2, margin_error, confidence_level,
+                             population_size, design_effect, n)
 
 def plot_mean_confidence(data, confidence_level=0.95, title="Przedział ufności dla średniej"):
     """
@@ -131,7 +170,7 @@ def estimate_variance(data, confidence_level=0.95):
     --------
     dict : słownik z wynikami estymacji
     """
-    data = np.array(data)
+    data = np.asarray(data)
     n = len(data)
     sample_var = np.var(data, ddof=1)  # próbkowa wariancja
     sample_std = np.sqrt(sample_var)
@@ -220,7 +259,7 @@ def estimate_proportion(data, confidence_level=0.95):
     --------
     dict : słownik z wynikami estymacji
     """
-    data = np.array(data)
+    data = np.asarray(data)
     
     # Konwersja na format binarny jeśli potrzeba
     if data.dtype == bool:
@@ -235,7 +274,28 @@ def estimate_proportion(data, confidence_level=0.95):
         else:
             raise ValueError("Dane muszą być binarne lub logiczne")
     
-    n = len(data)
+    return estimate_proportion_from_counts(successes, len(data), confidence_level)
+
+def estimate_proportion_from_counts(successes, n, confidence_level=0.95):
+    """
+    Estymacja proporcji z przedziałem ufności na podstawie liczności
+
+    Pozwala estymować proporcję bez trzymania danych w pamięci, np. gdy
+    sukcesy i n zostały zliczone porcjami (funkcje_dane.stream_proportion).
+    
+    Parameters:
+    -----------
+    successes : int
+        Liczba sukcesów
+    n : int
+        Liczba obserwacji
+    confidence_level : float
+        Poziom ufności
+    
+    Returns:
+    --------
+    dict : słownik z wynikami estymacji (jak w estimate_proportion)
+    """
     p_hat = successes / n
     
     # Sprawdzenie reguły 5
@@ -271,28 +331,84 @@ def estimate_proportion(data, confidence_level=0.95):
         'n_1minus_p_hat': n * (1 - p_hat)
     }
 
-def sample_size_for_proportion(p_estimate, margin_error, confidence_level=0.95):
+def proportion_ztest(successes, n, p0, alternative='two-sided', se_from_p0=False):
+    """
+    Test z dla jednej proporcji na podstawie liczności
+    
+    Parameters:
+    -----------
+    successes : int
+        Liczba sukcesów
+    n : int
+        Liczba obserwacji
+    p0 : float
+        Proporcja w hipotezie zerowej
+    alternative : str
+        'two-sided', 'larger' lub 'smaller'
+    se_from_p0 : bool
+        Czy błąd standardowy liczyć z p0 (domyślnie z p̂, jak
+        statsmodels.stats.proportion.proportions_ztest)
+    
+    Returns:
+    --------
+    dict : statystyka z, p-value i wielkość efektu h Cohena
+    """
+    p_hat = successes / n
+    p_se = p0 if se_from_p0 else p_hat
+    se = np.sqrt(p_se * (1 - p_se) / n)
+    z = (p_hat - p0) / se
+    
+    if alternative == 'two-sided':
+        p_value = 2 * stats.norm.sf(abs(z))
+    elif alternative == 'larger':
+        p_value = stats.norm.sf(z)
+    elif alternative == 'smaller':
+        p_value = stats.norm.cdf(z)
+    else:
+        raise ValueError("alternative musi być 'two-sided', 'larger' lub 'smaller'")
+    
+    return {
+        'sample_size': n,
+        'successes': successes,
+        'proportion': p_hat,
+        'p0': p0,
+        'standard_error': se,
+        'z_statistic': z,
+        'p_value': p_value,
+        'alternative': alternative,
+        'cohens_h': 2 * np.arcsin(np.sqrt(p_hat)) - 2 * np.arcsin(np.sqrt(p0))
+    }
+
+def sample_size_for_proportion(p_estimate, margin_error=None, confidence_level=0.95,
+                               population_size=None, design_effect=1.0, n=None):
     """
     Oblicza minimalną wielkość próby dla proporcji
     
+    Argumenty liczbowe mogą być tablicami (rozgłaszanie jak w
+    `sample_size_for_mean`).
+    
     Parameters:
     -----------
-    p_estimate : float
+    p_estimate : float lub array
         Wstępne oszacowanie proporcji (użyj 0.5 dla maksymalnej wielkości próby)
-    margin_error : float
+    margin_error : float lub array
         Żądany margines błędu
-    confidence_level : float
+    confidence_level : float lub array
         Poziom ufności
+    population_size : float lub array, optional
+        Wielkość populacji N - poprawka dla populacji skończonej (domyślnie brak)
+    design_effect : float lub array
+        Efekt schematu losowania (deff)
+    n : float lub array, optional
+        Tryb odwrotny: budżet próby - zwracany jest osiągalny margines błędu
     
     Returns:
     --------
-    int : minimalna wielkość próby
+    int / np.ndarray : minimalna wielkość próby (lub margines błędu w trybie odwrotnym)
     """
-    alpha = 1 - confidence_level
-    z_critical = stats.norm.ppf(1 - alpha/2)
-    
-    n = (z_critical**2 * p_estimate * (1 - p_estimate)) / (margin_error**2)
-    return int(np.ceil(n))
+    p_estimate = np.asarray(p_estimate, dtype=float)
+    return _plan_sample_size(p_estimate * (1 - p_estimate), margin_error, confidence_level,
+                             population_size, design_effect, n)
 
 def plot_proportion_confidence(data, confidence_level=0.95):
     """
@@ -330,13 +446,73 @@ def plot_proportion_confidence(data, confidence_level=0.95):
     
     return results
 
+# === IMPUTACJA WIELOKROTNA (REGUŁY RUBINA) ===
+
+def pool_rubin(estimates, variances, confidence_level=0.95, dof_complete=None):
+    """
+    Łączenie wyników z M imputacji według reguł Rubina
+    
+    Parameters:
+    -----------
+    estimates : array-like
+        Oszacowania parametru z każdej imputacji (M lub M × k parametrów)
+    variances : array-like
+        Kwadraty błędów standardowych z każdej imputacji (ten sam kształt)
+    confidence_level : float
+        Poziom ufności
+    dof_complete : float, optional
+        Stopnie swobody analizy kompletnych danych - poprawka
+        Barnarda-Rubina dla małych prób
+    
+    Returns:
+    --------
+    dict : oszacowanie łączne, wariancje wewnątrz / między imputacjami /
+           całkowita, stopnie swobody, przedział ufności, względny wzrost
+           wariancji (riv) i frakcja brakującej informacji (fmi)
+    """
+    q = np.asarray(estimates, dtype=float)
+    u = np.asarray(variances, dtype=float)
+    m = q.shape[0]
+    
+    q_bar = q.mean(axis=0)
+    within = u.mean(axis=0)
+    between = q.var(axis=0, ddof=1)
+    total = within + (1 + 1/m) * between
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        riv = (1 + 1/m) * between / within
+        lam = (1 + 1/m) * between / total
+        df = (m - 1) * (1 + 1/riv) ** 2
+        if dof_complete is not None:
+            df_obs = (dof_complete + 1) / (dof_complete + 3) * dof_complete * (1 - lam)
+            df = 1 / (1/df + 1/df_obs)
+        fmi = (riv + 2 / (df + 3)) / (riv + 1)
+    
+    alpha = 1 - confidence_level
+    se = np.sqrt(total)
+    t_critical = stats.t.ppf(1 - alpha/2, df)
+    
+    return {
+        'n_imputations': m,
+        'estimate': q_bar,
+        'within_variance': within,
+        'between_variance': between,
+        'total_variance': total,
+        'standard_error': se,
+        'df': df,
+        'ci_lower': q_bar - t_critical * se,
+        'ci_upper': q_bar + t_critical * se,
+        'riv': riv,
+        'fmi': fmi
+    }
+
 # === FUNKCJE UNIWERSALNE ===
 
 def summary_statistics(data):
     """
     Podstawowe statystyki opisowe
     """
-    data = np.array(data)
+    data = np.asarray(data)
     
     return {
         'count': len(data),
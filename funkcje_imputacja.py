@@ -0,0 +1,561 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# === FUNKCJE POMOCNICZE ===
+
+def _group_codes(df, by):
+    """
+    Kody klas imputacji (groupby().ngroup()) - brak wartości w kolumnie grupującej to osobna klasa
+    """
+    if by is None:
+        return np.zeros(len(df), dtype=np.int64), 1
+    codes = df.groupby(by, dropna=False, sort=False, observed=True).ngroup().to_numpy()
+    return codes.astype(np.int64), int(codes.max()) + 1 if len(codes) else 0
+
+
+def _draw_donors(donor_rows, donor_codes, recipient_codes, n_groups, rng):
+    """
+    Losuje dawcę dla każdego biorcy z jego klasy - wszystkie losowania naraz
+
+    Dawcy są sortowani według klasy, więc klasa g zajmuje ciągły wycinek
+    [start[g], start[g] + count[g]); biorca dostaje pozycję
+    start[g] + floor(u * count[g]) dla u ~ U(0, 1). Biorcy z klas bez
+    dawców losują z całej puli.
+    """
+    order = np.argsort(donor_codes, kind='stable')
+    donor_rows = donor_rows[order]
+    count = np.bincount(donor_codes, minlength=n_groups)
+    start = np.cumsum(count) - count
+
+    pool_start = start[recipient_codes]
+    pool_size = count[recipient_codes]
+    empty = pool_size == 0
+    pool_start = np.where(empty, 0, pool_start)
+    pool_size = np.where(empty, len(donor_rows), pool_size)
+
+    u = rng.random(len(recipient_codes))
+    return donor_rows[pool_start + (u * pool_size).astype(np.int64)]
+
+
+# === IMPUTACJA HOT DECK ===
+
+def random_hot_deck_imputation(df, columns, by=None, joint=False, random_state=None):
+    """
+    Losowa imputacja hot deck (również w klasach imputacji) dla wielu kolumn
+
+    Każdy brak zastępowany jest wartością losowo wybranego dawcy - rekordu
+    z tą samą klasą (`by`), w którym wartość jest znana. Wszyscy dawcy
+    losowani są jednym wywołaniem generatora `np.random.Generator`, a klasy
+    wyznacza jedno `pd.factorize` i jedno sortowanie dawców - bez pętli
+    po wierszach.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dane
+    columns : str lub list
+        Kolumny do imputacji (liczbowe lub kategorialne)
+    by : str lub list, optional
+        Kolumny wyznaczające klasy imputacji (hot deck w klasach); klasy
+        bez żadnego dawcy korzystają z całej puli
+    joint : bool
+        Gdy True, jeden dawca (rekord kompletny we wszystkich `columns`)
+        uzupełnia wszystkie braki danego wiersza - zachowuje zależności
+        między imputowanymi zmiennymi
+    random_state : int lub np.random.Generator, optional
+        Ziarno lub generator liczb losowych
+
+    Returns:
+    --------
+    pd.DataFrame : kopia danych z uzupełnionymi brakami
+    """
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    rng = np.random.default_rng(random_state)
+    codes, n_groups = _group_codes(df, by)
+    out = df.copy()
+    missing = df[columns].isna().to_numpy()
+
+    if joint:
+        donor_rows = np.flatnonzero(~missing.any(axis=1))
+        recipients = np.flatnonzero(missing.any(axis=1))
+        if len(donor_rows) == 0 or len(recipients) == 0:
+            return out
+        donors = _draw_donors(donor_rows, codes[donor_rows], codes[recipients], n_groups, rng)
+        for j, col in enumerate(columns):
+            hole = missing[recipients, j]
+            col_idx = out.columns.get_loc(col)
+            out.iloc[recipients[hole], col_idx] = df[col].iloc[donors[hole]].to_numpy()
+        return out
+
+    for j, col in enumerate(columns):
+        donor_rows = np.flatnonzero(~missing[:, j])
+        recipients = np.flatnonzero(missing[:, j])
+        if len(donor_rows) == 0 or len(recipients) == 0:
+            continue
+        donors = _draw_donors(donor_rows, codes[donor_rows], codes[recipients], n_groups, rng)
+        out.iloc[recipients, out.columns.get_loc(col)] = df[col].iloc[donors].to_numpy()
+    return out
+
+
+# === IMPUTACJA K-NN ===
+
+def _knn_targets(donor_features, donor_values, query_features, k_max):
+    """
+    Wartości zmiennej celu u k_max najbliższych dawców (kolejno od najbliższego)
+
+    Sąsiedzi wyszukiwani są raz drzewem KD (scipy.spatial.cKDTree) w
+    metryce euklidesowej.
+    """
+    from scipy.spatial import cKDTree
+
+    k_max = min(k_max, len(donor_values))
+    _, idx = cKDTree(donor_features).query(query_features, k=k_max)
+    return donor_values[np.asarray(idx).reshape(len(query_features), k_max)]
+
+
+def knn_k_sweep(df, target, features, k_values=range(2, 16), mask_fraction=0.2,
+                standardize=False, random_state=None):
+    """
+    Dobór liczby sąsiadów k w imputacji k-NN jednym wyszukiwaniem sąsiadów
+
+    Część znanych wartości `target` jest sztucznie ukrywana, a dla
+    każdego ukrytego wiersza wyszukiwanych jest raz max(k_values)
+    najbliższych dawców (drzewo KD). Imputacja dla każdego mniejszego k
+    to średnia k pierwszych sąsiadów - czyli średnie prefiksowe jednej
+    macierzy (cumsum), zamiast osobnego dopasowania KNNImputer dla
+    każdego k. Dla kompletnych cech wynik odpowiada KNNImputer z wagami
+    jednakowymi (z dokładnością do kolejności sąsiadów w równych odległościach).
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dane
+    target : str
+        Kolumna imputowana
+    features : list
+        Kolumny cech do wyznaczania odległości (używane są wiersze z
+        kompletnymi cechami i znanym `target`)
+    k_values : iterable
+        Sprawdzane liczby sąsiadów
+    mask_fraction : float
+        Odsetek znanych wartości ukrywanych do oceny błędu
+    standardize : bool
+        Czy standaryzować cechy przed liczeniem odległości
+    random_state : int lub np.random.Generator, optional
+        Ziarno lub generator liczb losowych
+
+    Returns:
+    --------
+    pd.DataFrame : dla każdego k - MSE, RMSE i MAE imputacji ukrytych wartości
+    """
+    features = [features] if isinstance(features, str) else list(features)
+    data = df[[target] + features].dropna()
+    X = data[features].to_numpy(dtype=float)
+    y = data[target].to_numpy(dtype=float)
+    if standardize:
+        X = (X - X.mean(axis=0)) / X.std(axis=0, ddof=1)
+
+    rng = np.random.default_rng(random_state)
+    hidden = rng.random(len(y)) < mask_fraction
+    k_values = np.asarray(list(k_values), dtype=int)
+
+    neighbors = _knn_targets(X[~hidden], y[~hidden], X[hidden], int(k_values.max()))
+    prefix_means = np.cumsum(neighbors, axis=1) / np.arange(1, neighbors.shape[1] + 1)
+    errors = prefix_means[:, np.minimum(k_values, neighbors.shape[1]) - 1] - y[hidden][:, None]
+
+    mse = (errors ** 2).mean(axis=0)
+    return pd.DataFrame({
+        'mse': mse,
+        'rmse': np.sqrt(mse),
+        'mae': np.abs(errors).mean(axis=0),
+        'n_hidden': int(hidden.sum()),
+    }, index=pd.Index(k_values, name='k'))
+
+
+def knn_imputation(df, target, features, k=3, standardize=False):
+    """
+    Imputacja k-NN braków w kolumnie `target` (średnia k najbliższych dawców)
+
+    Dawcy to wiersze ze znanym `target` i kompletnymi cechami; wiersze z
+    brakami w cechach pozostają nieuzupełnione.
+
+    Returns:
+    --------
+    pd.DataFrame : kopia danych z uzupełnioną kolumną `target`
+    """
+    features = [features] if isinstance(features, str) else list(features)
+    X = df[features].to_numpy(dtype=float)
+    y = df[target].to_numpy(dtype=float)
+    complete = ~np.isnan(X).any(axis=1)
+    if standardize:
+        X = (X - np.nanmean(X, axis=0)) / np.nanstd(X, axis=0, ddof=1)
+
+    donors = complete & ~np.isnan(y)
+    recipients = complete & np.isnan(y)
+    out = df.copy()
+    if donors.any() and recipients.any():
+        neighbors = _knn_targets(X[donors], y[donors], X[recipients], k)
+        out.loc[recipients, target] = neighbors.mean(axis=1)
+    return out
+
+
+# === PROFIL BRAKÓW DANYCH ===
+
+# Liczba ustawionych bitów w każdym bajcie (dla NumPy bez np.bitwise_count)
+_BYTE_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+
+def _popcount(words, axis=-1):
+    """Liczba ustawionych bitów w słowach uint64, zsumowana wzdłuż osi"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=axis, dtype=np.int64)
+    as_bytes = words.view(np.uint8)
+    return _BYTE_POPCOUNT[as_bytes].sum(axis=axis, dtype=np.int64)
+
+
+def _null_bitsets(df, columns):
+    """
+    Maski braków kolumn spakowane do zbiorów bitów - jeden przebieg po każdej kolumnie
+
+    Returns:
+    --------
+    np.ndarray : tablica uint64 kolumny × słowa (bit r = brak w wierszu r)
+    """
+    n = len(df)
+    n_words = (n + 63) // 64
+    words = np.zeros((len(columns), n_words * 8), dtype=np.uint8)
+    for j, col in enumerate(columns):
+        packed = np.packbits(df[col].isna().to_numpy(), bitorder='little')
+        words[j, :len(packed)] = packed
+    return words.view(np.uint64)
+
+
+def _missing_comparisons(df, words, missing_cols, variables, block_rows=1 << 16):
+    """
+    Porównanie średnich zmiennych liczbowych między wierszami z brakiem i bez braku
+
+    Sumy w grupie "brak" liczone są iloczynem macierzowym rozpakowanych
+    blokami masek i wartości (wycentrowanych - dla stabilności numerycznej);
+    grupa "obserwowane" to różnica względem sum całkowitych. Test Welcha
+    dla każdej pary (kolumna z brakami, zmienna).
+    """
+    from scipy import stats
+
+    x = df[variables].to_numpy(dtype=float)
+    valid = ~np.isnan(x)
+    center = np.nanmean(x, axis=0)
+    xc = np.where(valid, x - center, 0.0)
+
+    n_total = valid.sum(axis=0)
+    s_total = xc.sum(axis=0)
+    q_total = (xc ** 2).sum(axis=0)
+    n_miss = np.zeros((len(missing_cols), len(variables)))
+    s_miss = np.zeros_like(n_miss)
+    q_miss = np.zeros_like(n_miss)
+
+    n = len(df)
+    for r0 in range(0, n, block_rows):
+        r1 = min(r0 + block_rows, n)
+        bits = words[:, r0 // 64:(r1 + 63) // 64].view(np.uint8)
+        m = np.unpackbits(bits, axis=1, bitorder='little')[:, :r1 - r0].astype(float)
+        n_miss += m @ valid[r0:r1]
+        s_miss += m @ xc[r0:r1]
+        q_miss += m @ xc[r0:r1] ** 2
+
+    n_obs = n_total - n_miss
+    s_obs = s_total - s_miss
+    q_obs = q_total - q_miss
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_m = s_miss / n_miss
+        mean_o = s_obs / n_obs
+        var_m = (q_miss - n_miss * mean_m ** 2) / (n_miss - 1)
+        var_o = (q_obs - n_obs * mean_o ** 2) / (n_obs - 1)
+        se2_m, se2_o = var_m / n_miss, var_o / n_obs
+        t = (mean_m - mean_o) / np.sqrt(se2_m + se2_o)
+        dof = (se2_m + se2_o) ** 2 / (se2_m ** 2 / (n_miss - 1) + se2_o ** 2 / (n_obs - 1))
+        smd = (mean_m - mean_o) / np.sqrt((var_m + var_o) / 2)
+    p_value = 2 * stats.t.sf(np.abs(t), dof)
+
+    rows, cols = np.meshgrid(np.arange(len(missing_cols)), np.arange(len(variables)), indexing='ij')
+    table = pd.DataFrame({
+        'column': np.asarray(missing_cols, dtype=object)[rows.ravel()],
+        'variable': np.asarray(variables, dtype=object)[cols.ravel()],
+        'n_missing': n_miss.ravel().astype(int),
+        'n_observed': n_obs.ravel().astype(int),
+        'mean_missing': (mean_m + center).ravel(),
+        'mean_observed': (mean_o + center).ravel(),
+        'smd': smd.ravel(),
+        't_statistic': t.ravel(),
+        'df': dof.ravel(),
+        'p_value': p_value.ravel(),
+    })
+    return table[table['column'] != table['variable']].reset_index(drop=True)
+
+
+def missingness_profile(df, columns=None, compare=None, p_adjust='bh'):
+    """
+    Profil braków danych: odsetki, współwystępowanie braków, korelacja braków i porównania typu MCAR
+
+    Maska braków każdej kolumny pakowana jest raz do zbioru bitów
+    (`np.packbits`, słowa uint64). Liczba wspólnych braków pary kolumn
+    to popcount iloczynu bitowego ich słów, a korelacja braków (jak mapa
+    ciepła missingno) wynika z tych liczności bez ponownego skanowania
+    danych.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dane
+    columns : list, optional
+        Kolumny profilowane (domyślnie wszystkie)
+    compare : list, optional
+        Zmienne liczbowe porównywane między wierszami z brakiem i bez braku
+        w każdej kolumnie z brakami (test Welcha; domyślnie wszystkie
+        liczbowe). Istotne różnice wskazują, że braki nie są MCAR.
+    p_adjust : str lub None
+        Korekta p-value porównań (metoda `adjust_pvalues`, np. 'bh')
+
+    Returns:
+    --------
+    dict : 'summary' (liczba i odsetek braków na kolumnę), 'co_missing'
+           (liczby wspólnych braków), 'nullity_corr' (korelacja masek
+           braków), 'mcar' (porównania średnich - jeden wiersz na parę)
+    """
+    columns = list(df.columns) if columns is None else list(columns)
+    n = len(df)
+    words = _null_bitsets(df, columns)
+    counts = _popcount(words, axis=1)
+
+    # Wspólne braki tylko dla kolumn z jakimikolwiek brakami
+    has_missing = np.flatnonzero(counts > 0)
+    co_missing = np.zeros((len(columns), len(columns)), dtype=np.int64)
+    sub = words[has_missing]
+    for a, i in enumerate(has_missing):
+        co_missing[i, has_missing[a:]] = _popcount(sub[a] & sub[a:], axis=1)
+    co_missing = np.maximum(co_missing, co_missing.T)
+
+    rate = counts / n if n else np.full(len(columns), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = co_missing / n - np.outer(rate, rate)
+        sd = np.sqrt(rate * (1 - rate))
+        nullity_corr = cov / np.outer(sd, sd)
+
+    summary = pd.DataFrame({'n_missing': counts, 'missing_rate': rate},
+                           index=pd.Index(columns, name='column'))
+    result = {
+        'summary': summary,
+        'co_missing': pd.DataFrame(co_missing, index=columns, columns=columns),
+        'nullity_corr': pd.DataFrame(nullity_corr, index=columns, columns=columns),
+    }
+
+    if compare is None:
+        compare = list(df.select_dtypes(include=[np.number, 'bool']).columns)
+    missing_cols = [columns[i] for i in has_missing]
+    if compare and missing_cols:
+        mcar = _missing_comparisons(df, words[has_missing], missing_cols, list(compare))
+        if p_adjust:
+            from funkcje_korekty import adjust_pvalues
+            mcar['p_adj'] = adjust_pvalues(mcar['p_value'].to_numpy(), p_adjust)
+        result['mcar'] = mcar
+    return result
+
+
+# === IMPUTACJA WIELOKROTNA (MICE) ===
+
+# Dane i ustawienia przekazywane procesom roboczym raz, przy starcie puli
+_WORKER_VALUES = None
+_WORKER_SETTINGS = None
+
+
+def _init_worker(values, settings):
+    global _WORKER_VALUES, _WORKER_SETTINGS
+    _WORKER_VALUES = values
+    _WORKER_SETTINGS = settings
+
+
+def _draw_regression(X_obs, y_obs, rng, ridge=1e-5):
+    """
+    Losowanie parametrów regresji liniowej z rozkładu a posteriori (imputacja "właściwa")
+
+    Returns:
+    --------
+    tuple : (β z MNK, wylosowane β*, wylosowane σ*)
+    """
+    xtx = X_obs.T @ X_obs
+    xtx[np.diag_indices_from(xtx)] += ridge * np.diag(xtx).mean()
+    chol = np.linalg.cholesky(np.linalg.inv(xtx))
+    beta = np.linalg.solve(xtx, X_obs.T @ y_obs)
+    resid = y_obs - X_obs @ beta
+    dof = max(len(y_obs) - X_obs.shape[1], 1)
+    sigma = np.sqrt(resid @ resid / rng.chisquare(dof))
+    beta_star = beta + sigma * chol @ rng.standard_normal(len(beta))
+    return beta, beta_star, sigma
+
+
+def _pmm_donors(yhat_obs, yhat_mis, y_obs, n_donors, rng):
+    """
+    Predictive mean matching - losowy dawca spośród n_donors najbliższych predykcji
+
+    Predykcje dawców są sortowane raz; kandydaci to okno 2 * n_donors
+    kolejnych dawców wokół pozycji z `np.searchsorted` - przy końcach
+    przesunięte do wnętrza, więc zawsze zawiera różnych dawców - z którego
+    wybierane jest n_donors najbliższych.
+    """
+    order = np.argsort(yhat_obs)
+    sorted_hat = yhat_obs[order]
+    n_obs = len(sorted_hat)
+    n_donors = min(n_donors, n_obs)
+
+    pos = np.searchsorted(sorted_hat, yhat_mis)
+    width = min(2 * n_donors, n_obs)
+    start = np.clip(pos - n_donors, 0, n_obs - width)
+    window = start[:, None] + np.arange(width)
+    dist = np.abs(sorted_hat[window] - yhat_mis[:, None])
+    nearest = np.take_along_axis(window, np.argsort(dist, axis=1)[:, :n_donors], axis=1)
+    pick = nearest[np.arange(len(yhat_mis)), rng.integers(0, n_donors, len(yhat_mis))]
+    return y_obs[order[pick]]
+
+
+def _mice_chain(values, seed, n_iter, method, n_donors):
+    """
+    Jeden łańcuch równań warunkowych - zwraca jeden uzupełniony zbiór danych
+    """
+    rng = np.random.default_rng(seed)
+    missing = np.isnan(values)
+    data = values.copy()
+    n, p = data.shape
+
+    # Start: losowy hot deck w każdej kolumnie
+    for j in np.flatnonzero(missing.any(axis=0) & ~missing.all(axis=0)):
+        observed = data[~missing[:, j], j]
+        data[missing[:, j], j] = observed[rng.integers(0, len(observed), missing[:, j].sum())]
+
+    visit = [j for j in np.argsort(missing.sum(axis=0), kind='stable')
+             if 0 < missing[:, j].sum() < n]
+    design = np.empty((n, p))
+    design[:, 0] = 1.0
+    for _ in range(n_iter):
+        for j in visit:
+            design[:, 1:] = np.delete(data, j, axis=1)
+            obs, mis = ~missing[:, j], missing[:, j]
+            beta, beta_star, sigma = _draw_regression(design[obs], data[obs, j], rng)
+            yhat_mis = design[mis] @ beta_star
+            if method == 'pmm':
+                data[mis, j] = _pmm_donors(design[obs] @ beta, yhat_mis, data[obs, j], n_donors, rng)
+            else:
+                data[mis, j] = yhat_mis + sigma * rng.standard_normal(mis.sum())
+    return data
+
+
+def _mice_worker(seed):
+    return _mice_chain(_WORKER_VALUES, seed, **_WORKER_SETTINGS)
+
+
+def multiple_imputation(df, columns=None, m=5, n_iter=10, method='pmm', n_donors=5,
+                        n_jobs=None, random_state=None):
+    """
+    Imputacja wielokrotna metodą równań łańcuchowych (MICE) - M zbiorów równolegle
+
+    Każda kolumna z brakami jest imputowana regresją liniową na
+    pozostałych kolumnach z parametrami losowanymi z rozkładu a
+    posteriori ('norm') lub dopasowaniem predykcji średnich ('pmm').
+    M niezależnych łańcuchów liczonych jest w procesach roboczych;
+    dane trafiają do procesów raz (przy starcie puli), a każdy łańcuch
+    dostaje własny, niezależny strumień losowy z `np.random.SeedSequence.spawn`,
+    więc wynik nie zależy od liczby procesów.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dane
+    columns : list, optional
+        Kolumny liczbowe biorące udział w imputacji (domyślnie wszystkie
+        liczbowe); każda musi mieć choć jedną obserwowaną wartość
+    m : int
+        Liczba imputacji (uzupełnionych zbiorów danych)
+    n_iter : int
+        Liczba cykli po wszystkich kolumnach w każdym łańcuchu
+    method : str
+        'pmm' (predictive mean matching) lub 'norm' (regresja bayesowska z szumem)
+    n_donors : int
+        Liczba kandydatów na dawcę w metodzie 'pmm'
+    n_jobs : int, optional
+        Liczba procesów (domyślnie liczba rdzeni; 1 = bez równoległości)
+    random_state : int, optional
+        Ziarno głównego strumienia losowego
+
+    Returns:
+    --------
+    list : M kopii `df` z uzupełnionymi kolumnami
+    """
+    if method not in ('pmm', 'norm'):
+        raise ValueError("method musi być 'pmm' lub 'norm'")
+    if columns is None:
+        columns = list(df.select_dtypes(include=[np.number, 'bool']).columns)
+    values = df[columns].to_numpy(dtype=float)
+    # Kolumna bez obserwacji nie ma czego uczyć, a jako predyktor zatrułaby NaN każdą regresję
+    empty = [c for c, is_empty in zip(columns, np.isnan(values).all(axis=0)) if is_empty]
+    if empty:
+        raise ValueError(f"Kolumny bez żadnej obserwowanej wartości: {empty} - usuń je z `columns`")
+    seeds = np.random.SeedSequence(random_state).spawn(m)
+    settings = {'n_iter': n_iter, 'method': method, 'n_donors': n_donors}
+
+    n_jobs = min(n_jobs or os.cpu_count() or 1, m)
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker,
+                                 initargs=(values, settings)) as pool:
+            completed = list(pool.map(_mice_worker, seeds))
+    else:
+        completed = [_mice_chain(values, seed, **settings) for seed in seeds]
+
+    # Zapisywane są tylko kolumny z brakami - pełne kolumny całkowite zachowują typ
+    filled = np.flatnonzero(np.isnan(values).any(axis=0))
+    imputations = []
+    for data in completed:
+        out = df.copy()
+        out[[columns[j] for j in filled]] = data[:, filled]
+        imputations.append(out)
+    return imputations
+
+
+def pool_imputations(imputations, column, parameter='mean', confidence_level=0.95):
+    """
+    Oszacowanie parametru z każdego uzupełnionego zbioru i połączenie regułami Rubina
+
+    Parameters:
+    -----------
+    imputations : list
+        Wynik `multiple_imputation`
+    column : str
+        Kolumna, której parametr jest szacowany
+    parameter : str lub callable
+        'mean', 'proportion' (funkcje z funkcje_est) lub funkcja
+        f(df) -> (oszacowanie, wariancja oszacowania)
+
+    Returns:
+    --------
+    dict : wynik `pool_rubin`
+    """
+    from funkcje_est import estimate_mean, estimate_proportion, pool_rubin
+
+    estimates, variances = [], []
+    for data in imputations:
+        if callable(parameter):
+            q, u = parameter(data)
+        elif parameter == 'mean':
+            res = estimate_mean(data[column], confidence_level)
+            q, u = res['mean'], res['standard_error'] ** 2
+        elif parameter == 'proportion':
+            res = estimate_proportion(data[column], confidence_level)
+            q, u = res['proportion'], res['standard_error'] ** 2
+        else:
+            raise ValueError("parameter musi być 'mean', 'proportion' lub funkcją")
+        estimates.append(q)
+        variances.append(u)
+
+    n = len(imputations[0])
+    dof_complete = n - 1 if parameter in ('mean', 'proportion') else None
+    return pool_rubin(estimates, variances, confidence_level, dof_complete)
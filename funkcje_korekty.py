@@ -0,0 +1,227 @@
+import numpy as np
+import pandas as pd
+
+# === FUNKCJE POMOCNICZE ===
+
+_METHODS = ('bonferroni', 'holm', 'hochberg', 'bh', 'by')
+
+
+def _check_method(method):
+    if method not in _METHODS + ('qvalue',):
+        raise ValueError("method musi być 'bonferroni', 'holm', 'hochberg', 'bh', 'by' lub 'qvalue'")
+
+
+def _harmonic(m):
+    """Suma 1 + 1/2 + ... + 1/m (stała c(m) procedury Benjamini-Yekutieli)"""
+    return (1.0 / np.arange(1, m + 1)).sum() if m > 0 else 1.0
+
+
+def _storey_pi0(p_sorted, lambda_):
+    """Oszacowanie Storeya odsetka prawdziwych hipotez zerowych π0"""
+    m = len(p_sorted)
+    if m == 0:
+        return 1.0
+    above = m - np.searchsorted(p_sorted, lambda_, side='right')
+    return min(1.0, above / (m * (1 - lambda_)))
+
+
+def _adjust_sorted(p_sorted, method, lambda_=0.5):
+    """
+    Skorygowane p-value dla posortowanego rosnąco wektora (bez NaN)
+    """
+    m = len(p_sorted)
+    i = np.arange(1, m + 1)
+    if method == 'bonferroni':
+        adj = m * p_sorted
+    elif method == 'holm':
+        adj = np.maximum.accumulate((m - i + 1) * p_sorted)
+    elif method == 'hochberg':
+        adj = np.minimum.accumulate(((m - i + 1) * p_sorted)[::-1])[::-1]
+    else:
+        adj = np.minimum.accumulate((m / i * p_sorted)[::-1])[::-1]
+        if method == 'by':
+            adj = adj * _harmonic(m)
+        elif method == 'qvalue':
+            adj = adj * _storey_pi0(p_sorted, lambda_)
+    return np.minimum(adj, 1.0)
+
+
+# === KOREKTA P-VALUE ===
+
+def adjust_pvalues(p_values, method='holm', lambda_=0.5):
+    """
+    Korekta p-value na wielokrotne testowanie - jedno sortowanie, O(m log m)
+
+    Parameters:
+    -----------
+    p_values : array-like, pd.Series lub pd.DataFrame
+        P-value (dowolny kształt; NaN są pomijane i zostają NaN)
+    method : str
+        'bonferroni', 'holm' (FWER), 'hochberg' (FWER, przy niezależności),
+        'bh' (FDR, Benjamini-Hochberg), 'by' (FDR, Benjamini-Yekutieli,
+        dowolna zależność) lub 'qvalue' (q-value Storeya)
+    lambda_ : float
+        Próg do oszacowania π0 dla method='qvalue'
+
+    Returns:
+    --------
+    np.ndarray / pd.Series / pd.DataFrame : skorygowane p-value w kształcie wejścia
+    """
+    _check_method(method)
+    values = np.asarray(p_values, dtype=float)
+    flat = values.ravel()
+    valid = np.flatnonzero(~np.isnan(flat))
+
+    order = valid[np.argsort(flat[valid])]
+    adjusted = np.full(flat.shape, np.nan)
+    adjusted[order] = _adjust_sorted(flat[order], method, lambda_)
+    adjusted = adjusted.reshape(values.shape)
+
+    if isinstance(p_values, pd.Series):
+        return pd.Series(adjusted, index=p_values.index, name=p_values.name)
+    if isinstance(p_values, pd.DataFrame):
+        return pd.DataFrame(adjusted, index=p_values.index, columns=p_values.columns)
+    return adjusted
+
+
+def correct_results(results, method='holm', alpha=0.05, column='p_value', lambda_=0.5):
+    """
+    Dodaje skorygowane p-value i decyzję do tabeli wyników testów
+
+    Działa z tabelami zwracanymi przez silniki testów (np. `test_columns`,
+    `oneway_anova`) - każdy wiersz to jedna hipoteza.
+
+    Returns:
+    --------
+    pd.DataFrame : kopia tabeli z kolumnami 'p_adj' i 'reject'
+    """
+    out = results.copy()
+    out['p_adj'] = adjust_pvalues(out[column].to_numpy(), method, lambda_)
+    out['reject'] = out['p_adj'] <= alpha
+    return out
+
+
+def multiple_testing_summary(p_values, alpha=0.05, methods=_METHODS + ('qvalue',), lambda_=0.5):
+    """
+    Porównanie procedur korekty - p-value są sortowane raz dla wszystkich metod
+
+    Returns:
+    --------
+    pd.DataFrame : jeden wiersz na metodę - liczba hipotez, liczba odrzuceń
+                   i największe odrzucone (surowe) p-value
+    """
+    p = np.asarray(p_values, dtype=float).ravel()
+    p_sorted = np.sort(p[~np.isnan(p)])
+    rows = []
+    for method in methods:
+        _check_method(method)
+        reject = _adjust_sorted(p_sorted, method, lambda_) <= alpha
+        rows.append({
+            'method': method,
+            'm': len(p_sorted),
+            'n_rejected': int(reject.sum()),
+            'threshold': p_sorted[reject].max() if reject.any() else np.nan,
+        })
+    return pd.DataFrame(rows).set_index('method')
+
+
+# === P-VALUE STRUMIENIOWE ===
+
+def _finite_chunks(chunks):
+    """Porcje p-value jako tablice float bez NaN"""
+    for chunk in chunks:
+        p = np.atleast_1d(np.asarray(chunk, dtype=float))
+        yield p[~np.isnan(p)]
+
+
+def streaming_threshold(chunks, method='bh', alpha=0.05, lambda_=0.5):
+    """
+    Próg odrzucenia dla p-value napływających porcjami (bez trzymania wszystkich)
+
+    Odrzucone mogą być tylko p-value <= alpha / scale (scale = 1, c(m) dla
+    'by', π0 dla 'qvalue'), a ich pozycje wśród wszystkich m wartości są
+    takie same jak wśród zachowanych - wystarczy więc liczyć m i
+    przechowywać tylko kandydatów. Dla 'qvalue' π0 <= 1 pozwala odrzucić
+    także p > alpha, a π0 znane jest dopiero po obejrzeniu wszystkich
+    wartości - porcje są wtedy przeglądane dwa razy (liczniki, potem
+    kandydaci p <= alpha / π0), więc `chunks` musi dać się iterować
+    ponownie (np. lista, a nie generator). Wynik jest dokładnie taki sam
+    jak dla pełnej tablicy; hipotezy odrzuca się w kolejnym przebiegu
+    warunkiem p <= threshold.
+
+    Parameters:
+    -----------
+    chunks : iterable
+        Porcje p-value (tablice lub pojedyncze liczby)
+    method : str
+        Jak w `adjust_pvalues`
+    alpha : float
+        Poziom FWER / FDR
+
+    Returns:
+    --------
+    dict : m, n_rejected, threshold (NaN gdy brak odrzuceń), pi0 dla 'qvalue'
+    """
+    _check_method(method)
+    if method == 'qvalue':
+        if iter(chunks) is chunks:
+            raise ValueError("Dla method='qvalue' chunks musi dać się iterować dwukrotnie (np. lista)")
+        m = 0
+        n_above_lambda = 0
+        for p in _finite_chunks(chunks):
+            m += len(p)
+            n_above_lambda += int((p > lambda_).sum())
+        pi0 = min(1.0, n_above_lambda / (m * (1 - lambda_))) if m else 1.0
+        bound = alpha / pi0 if pi0 > 0 else np.inf
+        kept = [p[p <= bound] for p in _finite_chunks(chunks)]
+    else:
+        m = 0
+        kept = []
+        for p in _finite_chunks(chunks):
+            m += len(p)
+            kept.append(p[p <= alpha])
+
+    small = np.sort(np.concatenate(kept)) if kept else np.empty(0)
+    k = len(small)
+    i = np.arange(1, k + 1)
+
+    # Reguły krokowe na k najmniejszych p-value spośród m
+    if method == 'bonferroni':
+        reject = small <= alpha / m
+    elif method == 'holm':
+        reject = np.logical_and.accumulate(small <= alpha / (m - i + 1))
+    elif method == 'hochberg':
+        ok = np.flatnonzero(small <= alpha / (m - i + 1))
+        reject = i <= (ok[-1] + 1 if len(ok) else 0)
+    else:
+        scale = pi0 if method == 'qvalue' else {'bh': 1.0, 'by': _harmonic(m)}[method]
+        ok = np.flatnonzero(small * scale <= alpha * i / m)
+        reject = i <= (ok[-1] + 1 if len(ok) else 0)
+
+    result = {
+        'm': m,
+        'n_rejected': int(reject.sum()),
+        'threshold': small[reject].max() if reject.any() else np.nan,
+    }
+    if method == 'qvalue':
+        result['pi0'] = pi0
+    return result
+
+
+# === PRZYKŁAD UŻYCIA ===
+
+if __name__ == "__main__":
+    # Sprawdzenie: wersja strumieniowa = korekta pełnej tablicy (dużo efektów -> π0 < 1)
+    rng = np.random.default_rng(42)
+    p_all = np.concatenate([rng.uniform(size=4000), rng.beta(0.3, 8, size=6000)])
+    p_all[rng.choice(len(p_all), 50, replace=False)] = np.nan
+    chunks = np.array_split(p_all, 17)
+
+    print("=== PRÓG STRUMIENIOWY A adjust_pvalues ===")
+    for method in _METHODS + ('qvalue',):
+        stream = streaming_threshold(chunks, method, alpha=0.05)
+        full = adjust_pvalues(p_all, method) <= 0.05
+        threshold = np.nanmax(p_all[full]) if full.any() else np.nan
+        assert stream['n_rejected'] == full.sum(), method
+        assert np.array_equal(stream['threshold'], threshold, equal_nan=True), method
+        print(f"{method:>10}: odrzucone {stream['n_rejected']}, próg {stream['threshold']:.4g}")
@@ -0,0 +1,290 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+# === FUNKCJE POMOCNICZE ===
+
+# Kody kategorii przekazywane procesom roboczym raz, przy starcie puli
+_WORKER_CODES = None
+_WORKER_LEVELS = None
+
+
+def _init_worker(codes, levels):
+    global _WORKER_CODES, _WORKER_LEVELS
+    _WORKER_CODES = codes
+    _WORKER_LEVELS = levels
+
+
+def _encode_categories(df, columns):
+    """
+    Koduje każdą kolumnę kategorialną raz (pd.factorize, brak danych = -1)
+
+    Returns:
+    --------
+    tuple : (macierz kodów n × p typu int32, wektor liczby kategorii)
+    """
+    codes = np.empty((len(df), len(columns)), dtype=np.int32)
+    levels = np.empty(len(columns), dtype=np.int64)
+    for j, col in enumerate(columns):
+        c, uniques = pd.factorize(df[col], sort=True)
+        codes[:, j] = c
+        levels[j] = len(uniques)
+    return codes, levels
+
+
+def _chi2_pair(ci, cj, ki, kj, bias_correction):
+    """
+    Chi-kwadrat i V Craméra dla pary kolumn z tablicy zbudowanej przez np.bincount
+    """
+    mask = (ci >= 0) & (cj >= 0)
+    table = np.bincount(ci[mask].astype(np.int64) * kj + cj[mask], minlength=ki * kj).reshape(ki, kj)
+    table = table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0]
+    n = table.sum()
+    r, c = table.shape
+    if n == 0 or r < 2 or c < 2:
+        return np.nan, np.nan, np.nan
+
+    expected = np.outer(table.sum(axis=1), table.sum(axis=0)) / n
+    chi2 = ((table - expected) ** 2 / expected).sum()
+    p_value = stats.chi2.sf(chi2, (r - 1) * (c - 1))
+    phi2 = chi2 / n
+
+    if bias_correction and n > 1:
+        # Poprawka Bergsmy (2013)
+        phi2 = max(0.0, phi2 - (r - 1) * (c - 1) / (n - 1))
+        r = r - (r - 1) ** 2 / (n - 1)
+        c = c - (c - 1) ** 2 / (n - 1)
+    denom = min(r - 1, c - 1)
+    v = np.sqrt(phi2 / denom) if denom > 0 else np.nan
+    return chi2, p_value, v
+
+
+def _chi2_pairs(pairs, bias_correction):
+    return [_chi2_pair(_WORKER_CODES[:, i], _WORKER_CODES[:, j],
+                       _WORKER_LEVELS[i], _WORKER_LEVELS[j], bias_correction)
+            for i, j in pairs]
+
+
+# === MACIERZ ASOCJACJI (V CRAMÉRA) ===
+
+def association_matrix(df, columns=None, bias_correction=True, n_jobs=None,
+                       min_pairs_parallel=200):
+    """
+    Macierz V Craméra i testów chi-kwadrat dla wszystkich par kolumn kategorialnych
+
+    Każda kolumna kodowana jest raz, a tablica kontyngencji pary powstaje
+    z `np.bincount` na połączonych kodach (kod_i * k_j + kod_j) - bez
+    `pd.crosstab`. Przy dużej liczbie par obliczenia rozdzielane są między
+    procesy; kody trafiają do procesów roboczych raz, przy starcie puli.
+    Statystyka chi-kwadrat liczona jest bez poprawki Yatesa.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dane
+    columns : list, optional
+        Kolumny do analizy (domyślnie tekstowe, kategorialne i logiczne)
+    bias_correction : bool
+        Czy stosować poprawkę obciążenia V Craméra (Bergsma)
+    n_jobs : int, optional
+        Liczba procesów (domyślnie liczba rdzeni; 1 = bez równoległości)
+    min_pairs_parallel : int
+        Minimalna liczba par, od której opłaca się uruchamiać procesy
+
+    Returns:
+    --------
+    dict : macierze (pd.DataFrame) 'cramers_v', 'chi2' i 'p_value'
+    """
+    if columns is None:
+        columns = list(df.select_dtypes(include=['object', 'category', 'bool', 'string']).columns)
+    codes, levels = _encode_categories(df, columns)
+    p = len(columns)
+    pairs = list(zip(*np.triu_indices(p, 1)))
+
+    n_jobs = n_jobs or os.cpu_count() or 1
+    if n_jobs > 1 and len(pairs) >= min_pairs_parallel:
+        batches = [pairs[s::n_jobs] for s in range(n_jobs)]
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker,
+                                 initargs=(codes, levels)) as pool:
+            parts = list(pool.map(_chi2_pairs, batches, [bias_correction] * n_jobs))
+        results = [None] * len(pairs)
+        for s, part in enumerate(parts):
+            results[s::n_jobs] = part
+    else:
+        _init_worker(codes, levels)
+        results = _chi2_pairs(pairs, bias_correction)
+
+    chi2 = np.full((p, p), np.nan)
+    p_value = np.full((p, p), np.nan)
+    v = np.eye(p)
+    for (i, j), (c2, pv, vv) in zip(pairs, results):
+        chi2[i, j] = chi2[j, i] = c2
+        p_value[i, j] = p_value[j, i] = pv
+        v[i, j] = v[j, i] = vv
+
+    return {
+        'cramers_v': pd.DataFrame(v, index=columns, columns=columns),
+        'chi2': pd.DataFrame(chi2, index=columns, columns=columns),
+        'p_value': pd.DataFrame(p_value, index=columns, columns=columns),
+    }
+
+
+# === KORELACJE (PEARSON, SPEARMAN, KENDALL) ===
+
+def _count_inversions(y):
+    """
+    Liczba inwersji w wektorze liczb całkowitych - sortowanie przez scalanie
+
+    Wersja wstępująca: na każdym poziomie wszystkie pary bloków długości w
+    są obsługiwane naraz - inwersje między lewym a prawym blokiem liczy
+    `np.searchsorted` na kluczach (nr pary, wartość), a scalanie to jedno
+    stabilne sortowanie tych kluczy.
+    """
+    a = np.asarray(y, dtype=np.int64)
+    n = len(a)
+    base = int(a.max()) + 1 if n else 1
+    pos = np.arange(n)
+    inversions = 0
+    w = 1
+    while w < n:
+        pair = pos // (2 * w)
+        is_right = (pos // w) % 2 == 1
+        keys = pair * base + a
+        left_keys = keys[~is_right]
+        right_keys = keys[is_right]
+        right_pair = pair[is_right]
+        # Elementy lewego bloku większe od elementu prawego bloku tej samej pary
+        upto = np.searchsorted(left_keys, right_keys, side='right')
+        left_end = np.searchsorted(left_keys, (right_pair + 1) * base, side='left')
+        inversions += int((left_end - upto).sum())
+        a = a[np.argsort(keys, kind='stable')]
+        w *= 2
+    return inversions
+
+
+def _tie_counts(codes):
+    cnt = np.bincount(codes)
+    cnt = cnt[cnt > 1].astype(float)
+    return ((cnt * (cnt - 1) / 2).sum(),
+            (cnt * (cnt - 1) * (cnt - 2)).sum(),
+            (cnt * (cnt - 1) * (2 * cnt + 5)).sum())
+
+
+def kendall_tau(x, y):
+    """
+    Tau-b Kendalla w czasie O(n log n) (algorytm Knighta) z p-value asymptotycznym
+
+    Parameters:
+    -----------
+    x, y : array-like
+        Wartości bez braków danych
+
+    Returns:
+    --------
+    tuple : (tau_b, p_value)
+    """
+    x = np.unique(np.asarray(x), return_inverse=True)[1].ravel()
+    y = np.unique(np.asarray(y), return_inverse=True)[1].ravel()
+    return _kendall_tau_codes(x, y)
+
+
+def _kendall_tau_codes(x, y):
+    """
+    Tau-b Kendalla dla gotowych kodów całkowitych 0..k-1 (bez ponownego kodowania)
+    """
+    n = len(x)
+
+    order = np.lexsort((y, x))
+    xs, ys = x[order], y[order]
+    discordant = _count_inversions(ys)
+
+    # Pary związane jednocześnie w x i y
+    joint_start = np.r_[True, (xs[1:] != xs[:-1]) | (ys[1:] != ys[:-1])]
+    joint = np.diff(np.r_[np.flatnonzero(joint_start), n]).astype(float)
+    n_joint = (joint * (joint - 1) / 2).sum()
+
+    x_tie, x0, x1 = _tie_counts(x)
+    y_tie, y0, y1 = _tie_counts(y)
+    total = n * (n - 1) / 2
+    con_minus_dis = total - x_tie - y_tie + n_joint - 2 * discordant
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tau = np.clip(con_minus_dis / np.sqrt(total - x_tie) / np.sqrt(total - y_tie), -1, 1)
+        m = n * (n - 1.0)
+        var = ((m * (2 * n + 5) - x1 - y1) / 18
+               + (2 * x_tie * y_tie) / m + x0 * y0 / (9 * m * (n - 2)))
+        p_value = 2 * stats.norm.sf(abs(con_minus_dis) / np.sqrt(var))
+    return tau, p_value
+
+
+def correlation_matrix(df, method='pearson', columns=None, confidence_level=0.95):
+    """
+    Macierz korelacji z p-value i przedziałami ufności (transformacja z Fishera)
+
+    Pearson i Spearman liczone są jednym iloczynem macierzowym
+    standaryzowanych danych (dla Spearmana - rang policzonych raz dla
+    każdej kolumny). Kendall (tau-b) używa algorytmu Knighta O(n log n)
+    na kodach kolumn wyznaczonych raz. Wiersze z brakami danych są
+    pomijane (analiza kompletnych przypadków).
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dane
+    method : str
+        'pearson', 'spearman' lub 'kendall'
+    columns : list, optional
+        Kolumny (domyślnie wszystkie liczbowe)
+    confidence_level : float
+        Poziom ufności przedziałów
+
+    Returns:
+    --------
+    dict : macierze (pd.DataFrame) 'r', 'p_value', 'ci_lower', 'ci_upper' oraz 'n'
+    """
+    from funkcje_testy import rank_columns
+
+    if columns is None:
+        columns = list(df.select_dtypes(include=[np.number, 'bool']).columns)
+    values = df[columns].dropna().to_numpy(dtype=float)
+    n, p = values.shape
+
+    if method in ('pearson', 'spearman'):
+        data = rank_columns(values)[0] if method == 'spearman' else values
+        z = (data - data.mean(axis=0)) / data.std(axis=0, ddof=1)
+        r = np.clip(z.T @ z / (n - 1), -1, 1)
+        np.fill_diagonal(r, 1.0)
+        with np.errstate(divide='ignore'):
+            t = r * np.sqrt((n - 2) / (1 - r ** 2))
+        p_value = 2 * stats.t.sf(np.abs(t), n - 2)
+        # Błąd standardowy z: Fisher (Pearson), Fieller i in. (Spearman)
+        se = np.sqrt((1.0 if method == 'pearson' else 1.06) / (n - 3))
+    elif method == 'kendall':
+        codes = [np.unique(values[:, j], return_inverse=True)[1].ravel() for j in range(p)]
+        r = np.eye(p)
+        p_value = np.zeros((p, p))
+        for i, j in zip(*np.triu_indices(p, 1)):
+            r[i, j], p_value[i, j] = _kendall_tau_codes(codes[i], codes[j])
+            r[j, i], p_value[j, i] = r[i, j], p_value[i, j]
+        se = np.sqrt(0.437 / (n - 4))  # Fieller i in.
+    else:
+        raise ValueError("method musi być 'pearson', 'spearman' lub 'kendall'")
+
+    z_crit = stats.norm.ppf(1 - (1 - confidence_level) / 2)
+    with np.errstate(divide='ignore'):
+        fisher_z = np.arctanh(r)
+    ci_lower = np.tanh(fisher_z - z_crit * se)
+    ci_upper = np.tanh(fisher_z + z_crit * se)
+
+    def frame(a):
+        return pd.DataFrame(a, index=columns, columns=columns)
+
+    return {
+        'r': frame(r),
+        'p_value': frame(p_value),
+        'ci_lower': frame(ci_lower),
+        'ci_upper': frame(ci_upper),
+        'n': n,
+    }
@@ -0,0 +1,234 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+# === FUNKCJE POMOCNICZE ===
+
+def _critical(alpha, alternative):
+    if alternative == 'two-sided':
+        return alpha / 2
+    if alternative in ('larger', 'smaller'):
+        return alpha
+    raise ValueError("alternative musi być 'two-sided', 'larger' lub 'smaller'")
+
+
+def _t_design(nobs, kind, ratio):
+    """
+    Stopnie swobody i efektywna liczność (mnożnik parametru niecentralności)
+
+    Returns:
+    --------
+    tuple : (df, n_eff) - parametr niecentralności to d * √n_eff
+    """
+    nobs = np.asarray(nobs, dtype=float)
+    if kind in ('one-sample', 'paired'):
+        return nobs - 1, nobs
+    if kind == 'two-sample':
+        nobs2 = nobs * ratio
+        return nobs + nobs2 - 2, nobs * nobs2 / (nobs + nobs2)
+    raise ValueError("kind musi być 'one-sample', 'paired' lub 'two-sample'")
+
+
+def _solve_nobs(power_fn, target, lo, hi, n_min, n_iter=50, tol=1e-6):
+    """
+    n (ciągłe), dla którego moc = target - wyszukiwanie w przedziale dla całej siatki naraz
+
+    Przedział startowy [lo, hi] pochodzi z przybliżenia normalnego; tam,
+    gdzie moc w `lo` już przekracza target, dolnym końcem staje się `n_min`,
+    a tam, gdzie moc w `hi` jest za mała, przedział jest przesuwany i
+    podwajany. NaN dają scenariusze, w których zadanej mocy nie da się
+    osiągnąć (moc graniczna przy n -> ∞ jest za mała), w których moc przy
+    `n_min` już ją przekracza (target poniżej mocy najmniejszej próby, np.
+    poniżej alpha) oraz te, w których moc nie daje się policzyć.
+    Następnie przedział jest zawężany jak w bisekcji, ale punkt podziału
+    wybiera metoda regula falsi (wariant Illinois) - zbieżność w kilku
+    krokach zamiast kilkunastu, co przy kosztownym rozkładzie niecentralnym
+    t ma znaczenie.
+
+    Returns:
+    --------
+    np.ndarray lub float : liczność (float dla skalarnych argumentów)
+    """
+    lo = np.asarray(lo, dtype=float)
+    hi = np.asarray(hi, dtype=float)
+    n_min = np.full(lo.shape, n_min, dtype=float)
+    f_min = power_fn(n_min) - target
+    f_lo = power_fn(lo) - target
+    lo, f_lo = np.where(f_lo > 0, n_min, lo), np.where(f_lo > 0, f_min, f_lo)
+    hi = np.maximum(hi, lo)
+    f_hi = power_fn(hi) - target
+    # Moc graniczna przy n -> ∞ (np. d < 0 przy alternative='larger' - nigdy nie rośnie)
+    infeasible = ~(power_fn(np.full(hi.shape, 1e12)) - target >= 0) | ~(f_min <= 0)
+    for _ in range(60):
+        short = (f_hi < 0) & ~infeasible
+        if not short.any():
+            break
+        lo, f_lo = np.where(short, hi, lo), np.where(short, f_hi, f_lo)
+        hi = np.where(short, hi * 2, hi)
+        f_hi = np.where(short, power_fn(hi) - target, f_hi)
+    infeasible |= ~(np.isfinite(f_lo) & np.isfinite(f_hi))
+
+    x = hi
+    side = np.zeros(x.shape, dtype=np.int8)
+    for _ in range(n_iter):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = np.where((f_hi > f_lo) & ~infeasible, hi - f_hi * (hi - lo) / (f_hi - f_lo), hi)
+        f_x = power_fn(x) - target
+        # Moc, której nie da się policzyć, nie może zastąpić końca przedziału
+        failed = ~np.isfinite(f_x)
+        infeasible |= failed
+        above = (f_x >= 0) & ~failed
+        below = (f_x < 0) & ~failed
+        # Illinois: gdy ten sam koniec zostaje dwa razy z rzędu, jego wartość jest połowiona
+        f_lo = np.where(above & (side == 1), f_lo / 2, f_lo)
+        f_hi = np.where(below & (side == -1), f_hi / 2, f_hi)
+        hi, f_hi = np.where(above, x, hi), np.where(above, f_x, f_hi)
+        lo, f_lo = np.where(below, x, lo), np.where(below, f_x, f_lo)
+        side = np.where(above, 1, np.where(below, -1, side)).astype(np.int8)
+        if np.all((np.abs(f_x) < 1e-10) | (hi - lo < tol) | infeasible):
+            break
+    return np.where(infeasible, np.nan, x)[()]
+
+
+# === MOC TESTU ===
+
+def power_ttest(effect_size, nobs, alpha=0.05, alternative='two-sided', kind='one-sample', ratio=1.0):
+    """
+    Moc testu t (niecentralny rozkład t) dla tablic parametrów
+
+    Wszystkie argumenty liczbowe mogą być tablicami - są rozgłaszane
+    (broadcasting) jak w NumPy, więc cała siatka scenariuszy liczona jest
+    jednym wywołaniem. Wyniki zgodne z statsmodels TTestPower / TTestIndPower.
+
+    Parameters:
+    -----------
+    effect_size : float lub array
+        d Cohena
+    nobs : float lub array
+        Liczność (dla 'two-sample' - liczność pierwszej grupy)
+    alpha : float lub array
+        Poziom istotności
+    alternative : str
+        'two-sided', 'larger' lub 'smaller'
+    kind : str
+        'one-sample', 'paired' lub 'two-sample'
+    ratio : float lub array
+        n2 / n1 dla testu dla dwóch prób
+
+    Returns:
+    --------
+    np.ndarray : moc testu
+    """
+    effect_size = np.asarray(effect_size, dtype=float)
+    dof, n_eff = _t_design(nobs, kind, ratio)
+    nc = effect_size * np.sqrt(n_eff)
+    crit = stats.t.isf(_critical(np.asarray(alpha, dtype=float), alternative), dof)
+
+    # Oba ogony przez funkcję przeżycia: P(T <= -c | nc) = P(T >= c | -nc);
+    # dystrybuanta (nctdtr, nct.cdf) daje NaN w dalekich ogonach przy dużym nc
+    if alternative == 'larger':
+        return stats.nct.sf(crit, dof, nc)
+    if alternative == 'smaller':
+        return stats.nct.sf(crit, dof, -nc)
+    return stats.nct.sf(crit, dof, nc) + stats.nct.sf(crit, dof, -nc)
+
+
+def power_normal(effect_size, nobs, alpha=0.05, alternative='two-sided', ratio=0.0):
+    """
+    Moc testu z (rozkład normalny) dla tablic parametrów
+
+    Dla ratio=0 test dla jednej próby, dla ratio>0 dla dwóch prób
+    (n2 = ratio * n1) - jak statsmodels NormalIndPower.
+
+    Returns:
+    --------
+    np.ndarray : moc testu
+    """
+    effect_size = np.asarray(effect_size, dtype=float)
+    nobs = np.asarray(nobs, dtype=float)
+    ratio = np.asarray(ratio, dtype=float)
+    with np.errstate(divide='ignore'):
+        n_eff = np.where(ratio > 0, 1 / (1 / nobs + 1 / (nobs * ratio)), nobs)
+    shift = effect_size * np.sqrt(n_eff)
+    crit = stats.norm.isf(_critical(np.asarray(alpha, dtype=float), alternative))
+
+    if alternative == 'larger':
+        return stats.norm.sf(crit - shift)
+    if alternative == 'smaller':
+        return stats.norm.cdf(-crit - shift)
+    return stats.norm.sf(crit - shift) + stats.norm.cdf(-crit - shift)
+
+
+# === WIELKOŚĆ PRÓBY ===
+
+def _normal_nobs(effect_size, power, alpha, alternative, n_factor):
+    z_alpha = stats.norm.isf(_critical(alpha, alternative))
+    z_beta = stats.norm.ppf(power)
+    return n_factor * ((z_alpha + z_beta) / np.abs(effect_size)) ** 2
+
+
+def sample_size_ttest(effect_size, power=0.8, alpha=0.05, alternative='two-sided',
+                      kind='one-sample', ratio=1.0):
+    """
+    Liczność potrzebna do osiągnięcia zadanej mocy testu t - dla całej siatki naraz
+
+    Punkt startowy daje wzór dla rozkładu normalnego, a dokładną wartość
+    bisekcja wektorowa na `power_ttest` (wszystkie scenariusze w każdym kroku).
+
+    Returns:
+    --------
+    np.ndarray lub float : liczność (ciągła; dla 'two-sample' - pierwszej grupy)
+    """
+    effect_size, power, alpha, ratio = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (effect_size, power, alpha, ratio)))
+    n_factor = 1 + 1 / ratio if kind == 'two-sample' else 1.0
+    lo = np.maximum(_normal_nobs(effect_size, power, alpha, alternative, n_factor), 2.0)
+    # Poprawka Guenthera: n_t ≈ n_z + z_alpha² / 2 - górna granica z zapasem
+    hi = lo + stats.norm.isf(_critical(alpha, alternative)) ** 2 + 2
+
+    def power_fn(n):
+        return power_ttest(effect_size, n, alpha, alternative, kind, ratio)
+
+    # n = 2 - najmniejsza liczność z dodatnią liczbą stopni swobody
+    return _solve_nobs(power_fn, power, lo, hi, n_min=2.0)
+
+
+def sample_size_normal(effect_size, power=0.8, alpha=0.05, alternative='two-sided', ratio=0.0):
+    """
+    Liczność potrzebna do osiągnięcia zadanej mocy testu z - dla całej siatki naraz
+
+    Returns:
+    --------
+    np.ndarray lub float : liczność (ciągła; przy ratio>0 - pierwszej grupy)
+    """
+    effect_size, power, alpha, ratio = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (effect_size, power, alpha, ratio)))
+    with np.errstate(divide='ignore'):
+        n_factor = np.where(ratio > 0, 1 + 1 / ratio, 1.0)
+    # Wzór zamknięty pomija drugi ogon testu dwustronnego - wynik jest z niego tylko korygowany
+    n_z = _normal_nobs(effect_size, power, alpha, alternative, n_factor)
+
+    def power_fn(n):
+        return power_normal(effect_size, n, alpha, alternative, ratio)
+
+    return _solve_nobs(power_fn, power, np.maximum(n_z * 0.9, 1e-3), n_z, n_min=1e-3)
+
+
+def power_table(effect_size, nobs, alpha=0.05, alternative='two-sided', kind='one-sample', ratio=1.0):
+    """
+    Tabela mocy testu t dla iloczynu kartezjańskiego parametrów (np. do wykresów)
+
+    Returns:
+    --------
+    pd.DataFrame : kolumny effect_size, nobs, alpha, ratio, power
+    """
+    grid = np.meshgrid(np.atleast_1d(effect_size), np.atleast_1d(nobs),
+                       np.atleast_1d(alpha), np.atleast_1d(ratio), indexing='ij')
+    d, n, a, r = (g.ravel() for g in grid)
+    return pd.DataFrame({
+        'effect_size': d,
+        'nobs': n,
+        'alpha': a,
+        'ratio': r,
+        'power': power_ttest(d, n, a, alternative, kind, r),
+    })
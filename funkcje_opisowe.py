@@ -0,0 +1,339 @@
+import numpy as np
+import pandas as pd
+
+# === FUNKCJE POMOCNICZE ===
+
+def _group_index(df, by):
+    """
+    Kody grup (0..G-1, -1 = brak klucza) i indeks grup w kolejności posortowanej
+
+    Returns:
+    --------
+    tuple : (kody wierszy, pd.Index lub pd.MultiIndex grup)
+    """
+    if by is None:
+        return np.zeros(len(df), dtype=np.int64), None
+    grouped = df.groupby(by, sort=True, observed=True)
+    return grouped.ngroup().fillna(-1).to_numpy(dtype=np.int64), grouped.size().index
+
+
+def _quantile_labels(quantiles):
+    return [f'{q * 100:g}%' for q in quantiles]
+
+
+# === MOMENTY W GRUPACH ===
+
+def grouped_moments(df, by=None, columns=None, quantiles=(0.25, 0.5, 0.75)):
+    """
+    Liczność, średnia, sumy momentów centralnych M2-M4, minimum, maksimum i kwantyle
+    dla wszystkich kolumn × grup w jednym przebiegu po posortowanych danych
+
+    Każda kolumna sortowana jest raz według (grupa, wartość).
+    Grupy zajmują wtedy ciągłe wycinki: sumy i momenty liczone są przez
+    `np.bincount` z wagami (odchylenia od średniej grupy - dwa przebiegi,
+    stabilnie numerycznie), minimum i maksimum to końce wycinków, a
+    kwantyle (interpolacja liniowa jak w pandas) - indeksowanie w wycinkach.
+    Braki danych są pomijane.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dane
+    by : str lub list, optional
+        Kolumny grupujące (domyślnie brak - cała ramka to jedna grupa)
+    columns : list, optional
+        Kolumny liczbowe (domyślnie wszystkie liczbowe poza `by`)
+    quantiles : tuple
+        Kwantyle do wyznaczenia
+
+    Returns:
+    --------
+    pd.DataFrame : jeden wiersz na (grupa, kolumna) - count, mean, M2, M3,
+                   M4 (sumy (x - średnia)^k), min, kwantyle, max
+    """
+    keys = [] if by is None else ([by] if isinstance(by, str) else list(by))
+    if columns is None:
+        columns = [c for c in df.select_dtypes(include=[np.number, 'bool']).columns if c not in keys]
+    codes, groups = _group_index(df, by)
+    n_groups = 1 if groups is None else len(groups)
+    quantiles = np.asarray(quantiles, dtype=float)
+    labels = _quantile_labels(quantiles)
+
+    blocks = []
+    for col in columns:
+        x = df[col].to_numpy(dtype=float)
+        keep = ~np.isnan(x) & (codes >= 0)
+        xk, ck = x[keep], codes[keep]
+        # Sortowanie według wartości, potem stabilne według grupy = porządek (grupa, wartość)
+        order = np.argsort(xk)
+        order = order[np.argsort(ck[order], kind='stable')]
+        xs, cs = xk[order], ck[order]
+
+        count = np.bincount(cs, minlength=n_groups)
+        start = np.cumsum(count) - count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.bincount(cs, weights=xs, minlength=n_groups) / count
+        d = xs - mean[cs]
+        d2 = d * d
+        m2 = np.bincount(cs, weights=d2, minlength=n_groups)
+        m3 = np.bincount(cs, weights=d2 * d, minlength=n_groups)
+        m4 = np.bincount(cs, weights=d2 * d2, minlength=n_groups)
+
+        empty = count == 0
+        last = np.where(empty, 0, start + count - 1)
+        first = np.where(empty, 0, start)
+        xs_safe = xs if len(xs) else np.array([np.nan])
+        block = {
+            'count': count.astype(float),
+            'mean': mean,
+            'M2': m2,
+            'M3': m3,
+            'M4': m4,
+            'min': np.where(empty, np.nan, xs_safe[first]),
+        }
+        # Kwantyle: pozycja h = (n - 1) q w wycinku grupy, interpolacja liniowa
+        h = (np.maximum(count, 1) - 1)[:, None] * quantiles
+        lower = np.floor(h).astype(np.int64)
+        pos = first[:, None] + lower
+        nxt = np.minimum(pos + 1, last[:, None])
+        qv = xs_safe[pos] + (h - lower) * (xs_safe[nxt] - xs_safe[pos])
+        for k, label in enumerate(labels):
+            block[label] = np.where(empty, np.nan, qv[:, k])
+        block['max'] = np.where(empty, np.nan, xs_safe[last])
+        blocks.append(pd.DataFrame(block))
+
+    table = pd.concat(blocks, keys=columns, names=['column', '_group'])
+    if groups is None:
+        return table.droplevel('_group')
+    table.index = table.index.droplevel('_group')
+    group_frame = groups.to_frame(index=False)
+    table.index = pd.MultiIndex.from_arrays(
+        [np.tile(group_frame[c].to_numpy(), len(columns)) for c in group_frame.columns]
+        + [table.index.get_level_values('column')],
+        names=list(group_frame.columns) + ['column'])
+    return table.sort_index(level=list(range(len(group_frame.columns))), sort_remaining=False)
+
+
+def describe_table(df, by=None, columns=None, quantiles=(0.25, 0.5, 0.75)):
+    """
+    Tabela jak `describe()` uzupełniona o skośność i kurtozę - dla wszystkich grup naraz
+
+    Liczona z `grouped_moments`, więc zastępuje osobne wywołania
+    `describe()`, `skew()`, `kurt()` i `groupby(...).apply(lambda x: x.skew())`.
+    Odchylenie standardowe (ddof=1), skośność i kurtoza (nadwyżkowa) mają
+    te same poprawki na obciążenie co w pandas.
+
+    Returns:
+    --------
+    pd.DataFrame : kolumny count, mean, std, min, kwantyle, max, skew, kurt;
+                   wiersze - kolumny danych (lub pary grupa × kolumna)
+    """
+    m = grouped_moments(df, by, columns, quantiles)
+    n = m['count'].to_numpy()
+    m2, m3, m4 = (m[k].to_numpy() for k in ('M2', 'M3', 'M4'))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        std = np.where(n < 2, np.nan, np.sqrt(m2 / (n - 1)))
+        g1 = np.sqrt(n) * m3 / m2 ** 1.5
+        g2 = n * m4 / m2 ** 2 - 3
+        skew = np.sqrt(n * (n - 1)) / (n - 2) * g1
+        kurt = (n - 1) / ((n - 2) * (n - 3)) * ((n + 1) * g2 + 6)
+    # Jak w pandas: stała wartość daje 0, zbyt mała liczność - NaN
+    skew = np.where(n < 3, np.nan, np.where(m2 == 0, 0.0, skew))
+    kurt = np.where(n < 4, np.nan, np.where(m2 == 0, 0.0, kurt))
+
+    labels = _quantile_labels(quantiles)
+    out = pd.DataFrame({'count': n, 'mean': m['mean'].to_numpy(), 'std': std}, index=m.index)
+    out['min'] = m['min']
+    for label in labels:
+        out[label] = m[label]
+    out['max'] = m['max']
+    out['skew'] = skew
+    out['kurt'] = kurt
+    return out
+
+
+# === MIARY KSZTAŁTU OPARTE NA KWANTYLACH ===
+
+# Decyle skrajne, oktyle (Moors) i kwartyle - wszystkie z jednego sortowania
+_SHAPE_QUANTILES = (0.1, 0.125, 0.25, 0.375, 0.5, 0.625, 0.75, 0.875, 0.9)
+
+
+def shape_measures(df, by=None, columns=None):
+    """
+    Odporne miary kształtu i zmienności dla wszystkich kolumn × grup naraz
+
+    Wszystkie potrzebne kwantyle pochodzą z jednego wywołania
+    `grouped_moments` (jedno sortowanie na kolumnę), a nie z osobnych
+    `.quantile()` dla każdej grupy.
+
+    - bowley: skośność kwartylowa ((Q3 - Q2) - (Q2 - Q1)) / (Q3 - Q1)
+    - moors: kurtoza oktylowa ((E7 - E5) + (E3 - E1)) / (E6 - E2)
+      (ok. 1.233 dla rozkładu normalnego)
+    - iqr_kurtosis: współczynnik kurtozy (Q3 - Q1) / (2 (P90 - P10))
+      (ok. 0.263 dla rozkładu normalnego)
+    - qcd: kwartylowy współczynnik dyspersji (Q3 - Q1) / (Q3 + Q1)
+    - cv: współczynnik zmienności std / średnia
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dane
+    by : str lub list, optional
+        Kolumny grupujące
+    columns : list, optional
+        Kolumny liczbowe (domyślnie wszystkie liczbowe poza `by`)
+
+    Returns:
+    --------
+    pd.DataFrame : jeden wiersz na kolumnę (lub grupę × kolumnę)
+    """
+    m = grouped_moments(df, by, columns, _SHAPE_QUANTILES)
+    p10, e1, q1, e3, q2, e5, q3, e7, p90 = (m[label].to_numpy()
+                                             for label in _quantile_labels(_SHAPE_QUANTILES))
+    n = m['count'].to_numpy()
+    mean = m['mean'].to_numpy()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        std = np.where(n < 2, np.nan, np.sqrt(m['M2'].to_numpy() / (n - 1)))
+        return pd.DataFrame({
+            'count': n,
+            'median': q2,
+            'iqr': q3 - q1,
+            'bowley': ((q3 - q2) - (q2 - q1)) / (q3 - q1),
+            'moors': ((e7 - e5) + (e3 - e1)) / (q3 - q1),
+            'iqr_kurtosis': (q3 - q1) / (2 * (p90 - p10)),
+            'qcd': (q3 - q1) / (q3 + q1),
+            'cv': std / mean,
+        }, index=m.index)
+
+
+# === MIARY ROZPROSZENIA ===
+
+def bootstrap_samples(values, n_boot=2000, random_state=None):
+    """
+    Macierz prób bootstrapowych (n_boot × n) - wszystkie indeksy losowane jednym wywołaniem
+
+    Parameters:
+    -----------
+    values : array-like
+        Dane (bez braków)
+    n_boot : int
+        Liczba prób bootstrapowych
+    random_state : int lub np.random.Generator, optional
+        Ziarno lub generator liczb losowych
+
+    Returns:
+    --------
+    np.ndarray : próby w wierszach - statystyki liczy się redukcją po axis=1
+    """
+    values = np.asarray(values, dtype=float)
+    rng = np.random.default_rng(random_state)
+    return values[rng.integers(0, len(values), size=(n_boot, len(values)))]
+
+
+def _dispersion_rows(samples):
+    """Odchylenie, CV, IQR i MAD dla każdego wiersza macierzy prób"""
+    std = samples.std(axis=1, ddof=1)
+    q1, med, q3 = np.quantile(samples, [0.25, 0.5, 0.75], axis=1)
+    mad = np.median(np.abs(samples - med[:, None]), axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cv = std / samples.mean(axis=1)
+    return {'std': std, 'cv': cv, 'iqr': q3 - q1, 'mad': mad}
+
+
+def dispersion_table(df, by=None, columns=None, bootstrap=False, n_boot=2000,
+                     confidence_level=0.95, random_state=None, max_cells=20_000_000):
+    """
+    Porównanie rozproszenia (std, CV, IQR, odchylenie ćwiartkowe, MAD, rozstęp)
+    dla wszystkich kolumn × grup
+
+    Liczność, średnia, odchylenie, minimum, maksimum i kwartyle pochodzą z
+    jednego przebiegu `grouped_moments`; MAD (mediana |x - mediana grupy|)
+    z drugiego przebiegu na odchyleniach. Opcjonalne przedziały ufności to
+    przedziały percentylowe bootstrapu - dla każdej grupy wszystkie próby
+    są jedną macierzą (`bootstrap_samples`), a statystyki liczone są
+    redukcjami po wierszach.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dane
+    by : str lub list, optional
+        Kolumny grupujące
+    columns : list, optional
+        Kolumny liczbowe (domyślnie wszystkie liczbowe poza `by`)
+    bootstrap : bool
+        Czy dodać bootstrapowe przedziały ufności dla std, cv, iqr i mad
+    n_boot : int
+        Liczba prób bootstrapowych
+    confidence_level : float
+        Poziom ufności przedziałów
+    random_state : int, optional
+        Ziarno generatora liczb losowych
+    max_cells : int
+        Największy rozmiar macierzy prób naraz (większe grupy dzielone są na porcje prób)
+
+    Returns:
+    --------
+    pd.DataFrame : jeden wiersz na kolumnę (lub grupę × kolumnę)
+    """
+    keys = [] if by is None else ([by] if isinstance(by, str) else list(by))
+    if columns is None:
+        columns = [c for c in df.select_dtypes(include=[np.number, 'bool']).columns if c not in keys]
+    m = grouped_moments(df, by, columns, (0.25, 0.5, 0.75))
+    n = m['count'].to_numpy()
+    codes, groups = _group_index(df, by)
+
+    # MAD: odchylenia od mediany własnej grupy i drugi przebieg tylko z medianą
+    deviations = df[keys].copy() if keys else pd.DataFrame(index=df.index)
+    for col in columns:
+        median = np.atleast_1d(m.loc[col, '50%']) if groups is None \
+            else m.xs(col, level='column')['50%'].to_numpy()
+        x = df[col].to_numpy(dtype=float)
+        deviations[col] = np.where(codes >= 0, np.abs(x - median[np.maximum(codes, 0)]), np.nan)
+    mad = grouped_moments(deviations, by, columns, (0.5,))['50%'].to_numpy()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        std = np.where(n < 2, np.nan, np.sqrt(m['M2'].to_numpy() / (n - 1)))
+        iqr = (m['75%'] - m['25%']).to_numpy()
+        table = pd.DataFrame({
+            'count': n,
+            'mean': m['mean'].to_numpy(),
+            'std': std,
+            'cv': std / m['mean'].to_numpy(),
+            'iqr': iqr,
+            'quartile_deviation': iqr / 2,
+            'mad': mad,
+            'range': (m['max'] - m['min']).to_numpy(),
+        }, index=m.index)
+
+    if bootstrap:
+        rng = np.random.default_rng(random_state)
+        alpha = 1 - confidence_level
+        ci = {}
+        for col in columns:
+            x = df[col].to_numpy(dtype=float)
+            keep = ~np.isnan(x) & (codes >= 0)
+            for g in range(1 if groups is None else len(groups)):
+                xg = x[keep & (codes == g)]
+                if groups is None:
+                    row = col
+                else:
+                    # Klucz grupy bez rzutowania typów (np.atleast_1d zamieniłby ('a', 0) na napisy)
+                    key = groups[g]
+                    row = (*(key if isinstance(key, tuple) else (key,)), col)
+                if len(xg) < 2:
+                    continue
+                # Porcje prób, by macierz n_boot × n nie przekroczyła max_cells
+                step = max(1, max_cells // len(xg))
+                parts = [_dispersion_rows(bootstrap_samples(xg, min(step, n_boot - b), rng))
+                         for b in range(0, n_boot, step)]
+                for stat in ('std', 'cv', 'iqr', 'mad'):
+                    draws = np.concatenate([p[stat] for p in parts])
+                    lower, upper = np.nanquantile(draws, [alpha / 2, 1 - alpha / 2])
+                    ci.setdefault(f'{stat}_ci_lower', {})[row] = lower
+                    ci.setdefault(f'{stat}_ci_upper', {})[row] = upper
+        for name in [f'{s}_{side}' for s in ('std', 'cv', 'iqr', 'mad') for side in ('ci_lower', 'ci_upper')]:
+            table[name] = pd.Series(ci.get(name, {}), dtype=float).reindex(table.index).to_numpy()
+    return table
@@ -0,0 +1,584 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+# === FUNKCJE POMOCNICZE ===
+
+def _as_float_matrix(data, columns=None):
+    """
+    Zamienia ramkę danych / tablicę na macierz float (obserwacje × kolumny)
+
+    Returns:
+    --------
+    tuple : (macierz 2D, lista nazw kolumn)
+    """
+    if isinstance(data, pd.DataFrame):
+        if columns is None:
+            columns = data.select_dtypes(include=[np.number, 'bool']).columns
+        values = data[list(columns)].to_numpy(dtype=float)
+        return values, list(columns)
+    if isinstance(data, pd.Series):
+        return data.to_numpy(dtype=float)[:, None], [data.name]
+    values = np.asarray(data, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    if columns is None:
+        columns = list(range(values.shape[1]))
+    return values, list(columns)
+
+
+def _per_column(value, columns):
+    """
+    Rozwija wartość skalarną, słownik lub Series do wektora zgodnego z kolumnami
+    """
+    if isinstance(value, (dict, pd.Series)):
+        return np.array([value[c] for c in columns], dtype=float)
+    return np.broadcast_to(np.asarray(value, dtype=float), (len(columns),)).copy()
+
+
+def _p_value(statistic, alternative, sf, cdf):
+    if alternative == 'two-sided':
+        return np.minimum(2 * sf(np.abs(statistic)), 1.0)
+    if alternative == 'larger':
+        return sf(statistic)
+    if alternative == 'smaller':
+        return cdf(statistic)
+    raise ValueError("alternative musi być 'two-sided', 'larger' lub 'smaller'")
+
+
+def rank_columns(values):
+    """
+    Rangi (średnie dla remisów) liczone niezależnie w każdej kolumnie
+
+    Każda kolumna jest sortowana raz (argsort), a grupy remisów wyznaczane
+    są z długości serii równych wartości w posortowanej tablicy. Braki
+    danych (NaN) nie dostają rangi.
+
+    Parameters:
+    -----------
+    values : array-like
+        Macierz obserwacje × kolumny (lub wektor)
+
+    Returns:
+    --------
+    tuple : (rangi o kształcie `values`, suma Σ(t³ - t) po grupach remisów
+             dla każdej kolumny, liczba obserwacji bez NaN w kolumnie)
+    """
+    a = np.asarray(values, dtype=float)
+    squeeze = a.ndim == 1
+    if squeeze:
+        a = a[:, None]
+    n, p = a.shape
+
+    # Praca na transpozycji w pamięci ciągłej - sortowanie wierszy jest dużo
+    # szybsze niż sortowanie kolumn tablicy w układzie C
+    at = np.ascontiguousarray(a.T)
+    order = np.argsort(at, axis=1)  # NaN trafiają na koniec; stabilność zbędna - remisy dostają średnią rangę
+    s = np.take_along_axis(at, order, axis=1)
+    valid = ~np.isnan(s)
+    n_valid = valid.sum(axis=1)
+
+    start = np.ones((p, n), dtype=bool)
+    start[:, 1:] = s[:, 1:] != s[:, :-1]
+    pos = np.broadcast_to(np.arange(n), (p, n))
+
+    # Początek serii dla każdej pozycji i długość serii (przez identyfikator serii)
+    first = np.maximum.accumulate(np.where(start, pos, 0), axis=1)
+    run_id = np.cumsum(start, axis=1) - 1 + np.arange(p)[:, None] * n
+    run_len = np.bincount(run_id.ravel(), minlength=n * p)[run_id]
+
+    ranks_sorted = first + (run_len + 1) / 2
+    ranks_sorted[~valid] = np.nan
+
+    ranks_t = np.empty_like(at)
+    np.put_along_axis(ranks_t, order, ranks_sorted, axis=1)
+    ranks = ranks_t.T
+
+    tie_term = np.where(start & valid, run_len.astype(float) ** 3 - run_len, 0.0).sum(axis=1)
+
+    if squeeze:
+        return ranks[:, 0], tie_term[0], n_valid[0]
+    return ranks, tie_term, n_valid
+
+
+def _signed_rank(diff, alternative):
+    """
+    Test Wilcoxona znakowanych rang (przybliżenie normalne) dla każdej kolumny
+
+    Zera są pomijane (metoda 'wilcox'), poprawka na remisy z długości serii.
+    """
+    d = np.where(diff == 0, np.nan, diff)
+    ranks, tie_term, n_eff = rank_columns(np.abs(d))
+    w_plus = np.nansum(np.where(d > 0, ranks, 0.0), axis=0)
+
+    mean_w = n_eff * (n_eff + 1) / 4
+    var_w = n_eff * (n_eff + 1) * (2 * n_eff + 1) / 24 - tie_term / 48
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = (w_plus - mean_w) / np.sqrt(var_w)
+        p_value = _p_value(z, alternative, stats.norm.sf, stats.norm.cdf)
+        r = z / np.sqrt(n_eff)  # wielkość efektu r = Z / √n
+    return w_plus, z, p_value, r, n_eff, tie_term
+
+
+_SCIPY_ALTERNATIVE = {'two-sided': 'two-sided', 'larger': 'greater', 'smaller': 'less'}
+# Do tylu różnic test permutacyjny przegląda wszystkie 2^n zmian znaków (jak scipy)
+_PERMUTATION_MAX_N = 13
+
+
+def _wilcoxon_small_sample(diff, p_value, n_eff, tie_term, alternative, exact_threshold):
+    """
+    P-value dla małych kolumn testu Wilcoxona (nadpisywane w `p_value`), jak domyślnie w scipy
+
+    Bez remisów - rozkład dokładny W+ (do `exact_threshold` niezerowych
+    różnic); z remisami - test permutacyjny po wszystkich zmianach znaków
+    (do `_PERMUTATION_MAX_N` różnic). Pozostałe kolumny zostają
+    z przybliżeniem normalnym.
+
+    Returns:
+    --------
+    np.ndarray : metoda dla każdej kolumny ('exact', 'permutation' lub 'asymptotic')
+    """
+    method = np.full(diff.shape[1], 'asymptotic', dtype=object)
+    n_valid = (~np.isnan(diff)).sum(axis=0)
+    exact = (tie_term == 0) & (n_eff <= exact_threshold)
+    permutation = (tie_term > 0) & (n_valid <= _PERMUTATION_MAX_N)
+    for j in np.flatnonzero((exact | permutation) & (n_eff > 0)):
+        d = diff[:, j]
+        d = d[~np.isnan(d)]
+        if exact[j]:
+            p_value[j] = stats.wilcoxon(d[d != 0], alternative=_SCIPY_ALTERNATIVE[alternative],
+                                        method='exact').pvalue
+            method[j] = 'exact'
+        else:
+            p_value[j] = stats.wilcoxon(d, alternative=_SCIPY_ALTERNATIVE[alternative],
+                                        method=stats.PermutationMethod()).pvalue
+            method[j] = 'permutation'
+    return method
+
+
+def _mann_whitney_z(u1, n1, n2, tie_term, alternative, use_continuity):
+    """
+    Statystyka z i p-value testu Manna-Whitneya (przybliżenie normalne, jak scipy)
+    """
+    n = n1 + n2
+    mu = n1 * n2 / 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sigma = np.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+        if alternative == 'two-sided':
+            u = np.maximum(u1, n1 * n2 - u1)
+        elif alternative == 'larger':
+            u = u1
+        elif alternative == 'smaller':
+            u = n1 * n2 - u1
+        else:
+            raise ValueError("alternative musi być 'two-sided', 'larger' lub 'smaller'")
+        z = (u - mu - (0.5 if use_continuity else 0.0)) / sigma
+        p_value = stats.norm.sf(z)
+        if alternative == 'two-sided':
+            p_value = np.minimum(2 * p_value, 1.0)
+        z_signed = (u1 - mu) / sigma
+    return z_signed, p_value
+
+
+# === TESTY DLA JEDNEJ PRÓBY ===
+
+def test_columns(df, mu0, test='t', alternative='two-sided', confidence_level=0.95,
+                 columns=None, sigma=None):
+    """
+    Test dla jednej próby wykonany jednocześnie dla wszystkich kolumn liczbowych
+
+    Wszystkie statystyki liczone są redukcjami NumPy po osi obserwacji,
+    bez pętli po kolumnach. Braki danych są pomijane w każdej kolumnie
+    osobno.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame lub array-like
+        Dane (obserwacje × kolumny)
+    mu0 : float, dict lub pd.Series
+        Wartość w hipotezie zerowej - wspólna lub osobna dla każdej kolumny
+    test : str
+        't' (t-Student), 'z' (rozkład normalny) lub 'wilcoxon'
+        (znakowanych rang, przybliżenie normalne; H0: mediana = mu0,
+        statystyka to suma rang dodatnich W+)
+    alternative : str
+        'two-sided', 'larger' lub 'smaller'
+    confidence_level : float
+        Poziom ufności przedziałów
+    columns : list, optional
+        Kolumny do testowania (domyślnie wszystkie liczbowe)
+    sigma : float, dict lub pd.Series, optional
+        Znane odchylenie standardowe populacji dla testu z
+
+    Returns:
+    --------
+    pd.DataFrame : jeden wiersz na kolumnę - liczność, średnia (mediana),
+                   statystyka, p-value, wielkość efektu i przedział ufności
+    """
+    values, columns = _as_float_matrix(df, columns)
+    mu0 = _per_column(mu0, columns)
+    alpha = 1 - confidence_level
+
+    n = (~np.isnan(values)).sum(axis=0)
+    mean = np.nanmean(values, axis=0)
+    std = np.nanstd(values, axis=0, ddof=1)
+
+    if test in ('t', 'z'):
+        scale = std if (test == 't' or sigma is None) else _per_column(sigma, columns)
+        se = scale / np.sqrt(n)
+        statistic = (mean - mu0) / se
+        if test == 't':
+            dist = stats.t(df=n - 1)
+            critical = stats.t.ppf(1 - alpha / 2, df=n - 1)
+        else:
+            dist = stats.norm()
+            critical = stats.norm.ppf(1 - alpha / 2)
+        p_value = _p_value(statistic, alternative, dist.sf, dist.cdf)
+
+        return pd.DataFrame({
+            'sample_size': n,
+            'mean': mean,
+            'std': std,
+            'mu0': mu0,
+            'standard_error': se,
+            'statistic': statistic,
+            'p_value': p_value,
+            'cohens_d': (mean - mu0) / scale,
+            'ci_lower': mean - critical * se,
+            'ci_upper': mean + critical * se,
+            'test': test,
+        }, index=pd.Index(columns, name='column'))
+
+    if test == 'wilcoxon':
+        w_plus, z, p_value, r, n_eff, _ = _signed_rank(values - mu0, alternative)
+
+        # Przedział ufności dla mediany z statystyk pozycyjnych (rozkład dwumianowy)
+        s = np.sort(values, axis=0)
+        k = stats.binom.ppf(alpha / 2, n, 0.5).astype(int)
+        lo = np.clip(k - 1, 0, np.maximum(n - 1, 0))
+        hi = np.clip(n - k, 0, np.maximum(n - 1, 0))
+        cols = np.arange(len(columns))
+
+        return pd.DataFrame({
+            'sample_size': n,
+            'n_nonzero': n_eff,
+            'median': np.nanmedian(values, axis=0),
+            'mu0': mu0,
+            'statistic': w_plus,
+            'z_statistic': z,
+            'p_value': p_value,
+            'effect_size_r': r,
+            'ci_lower': s[lo, cols],
+            'ci_upper': s[hi, cols],
+            'test': test,
+        }, index=pd.Index(columns, name='column'))
+
+    raise ValueError("test musi być 't', 'z' lub 'wilcoxon'")
+
+
+# === TESTY RANGOWE DLA DWÓCH PRÓB ===
+
+def mann_whitney_columns(x, y, alternative='two-sided', columns=None, use_continuity=True,
+                         exact_threshold=8):
+    """
+    Test Manna-Whitneya (U) dla dwóch prób, wykonany dla wielu kolumn naraz
+
+    Obie próby są łączone i rangowane raz (`rank_columns` - argsort na
+    kolumnę), poprawka na remisy pochodzi z długości serii równych
+    wartości. Dla prób większych niż `exact_threshold` (lub z remisami)
+    stosowane jest przybliżenie normalne z poprawką na ciągłość, jak w
+    scipy; tylko małe kolumny bez remisów liczone są dokładnie przez
+    scipy.stats.mannwhitneyu.
+
+    Parameters:
+    -----------
+    x, y : pd.DataFrame lub array-like
+        Próby (obserwacje × kolumny) o tych samych kolumnach
+    alternative : str
+        'two-sided', 'larger' (x stochastycznie większe) lub 'smaller'
+    columns : list, optional
+        Kolumny do testowania (domyślnie wszystkie liczbowe z x)
+    use_continuity : bool
+        Poprawka na ciągłość w przybliżeniu normalnym
+    exact_threshold : int
+        Test dokładny, gdy obie liczności < exact_threshold i brak remisów
+
+    Returns:
+    --------
+    pd.DataFrame : jeden wiersz na kolumnę - liczności, U (dla x), z,
+                   p-value, r = Z / √N, korelacja rangowo-dwuseryjna i CLES
+    """
+    xv, columns = _as_float_matrix(x, columns)
+    yv, _ = _as_float_matrix(y, columns)
+    ranks, tie_term, _ = rank_columns(np.vstack([xv, yv]))
+
+    n1 = (~np.isnan(xv)).sum(axis=0)
+    n2 = (~np.isnan(yv)).sum(axis=0)
+    u1 = np.nansum(ranks[:len(xv)], axis=0) - n1 * (n1 + 1) / 2
+    z, p_value = _mann_whitney_z(u1, n1, n2, tie_term, alternative, use_continuity)
+
+    exact = np.flatnonzero((n1 < exact_threshold) & (n2 < exact_threshold)
+                           & (tie_term == 0) & (n1 > 0) & (n2 > 0))
+    for j in exact:
+        a, b = xv[:, j], yv[:, j]
+        p_value[j] = stats.mannwhitneyu(a[~np.isnan(a)], b[~np.isnan(b)], method='exact',
+                                        alternative=_SCIPY_ALTERNATIVE[alternative]).pvalue
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cles = u1 / (n1 * n2)
+        r = z / np.sqrt(n1 + n2)
+    return pd.DataFrame({
+        'n1': n1,
+        'n2': n2,
+        'statistic': u1,
+        'z_statistic': z,
+        'p_value': p_value,
+        'method': np.where(np.isin(np.arange(len(columns)), exact), 'exact', 'asymptotic'),
+        'effect_size_r': r,
+        'rank_biserial': 2 * cles - 1,
+        'cles': cles,
+    }, index=pd.Index(columns, name='column'))
+
+
+def _value_runs(sorted_values):
+    """Wartości i liczności serii równych wartości w posortowanym wektorze"""
+    starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    return sorted_values[starts], np.diff(np.r_[starts, len(sorted_values)]).astype(float)
+
+
+def mann_whitney_groups(df, group, value, pairs=None, alternative='two-sided', use_continuity=True,
+                        exact_threshold=8):
+    """
+    Test Manna-Whitneya dla par segmentów (domyślnie wszystkich par grup)
+
+    Każda grupa jest sortowana raz, a jej serie równych wartości
+    wyznaczane raz. Dla pary (a, b) statystyka U_a = Σ (#b < x + ½ #b = x)
+    po x z a liczona jest przez `np.searchsorted` na posortowanych grupach,
+    a poprawka na remisy - z liczności serii obu grup dopasowanych przez
+    `np.searchsorted` (bez ponownego sortowania i rangowania). Małe pary
+    bez remisów liczone są dokładnie, jak w `mann_whitney_columns`.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dane w formacie długim
+    group : str
+        Kolumna z segmentami
+    value : str
+        Kolumna z wartościami
+    pairs : list of tuple, optional
+        Pary segmentów (domyślnie wszystkie pary)
+    exact_threshold : int
+        Test dokładny, gdy obie liczności < exact_threshold i brak remisów
+
+    Returns:
+    --------
+    pd.DataFrame : jeden wiersz na parę - group1, group2, liczności, U, z,
+                   p-value, r i korelacja rangowo-dwuseryjna
+    """
+    data = df[[group, value]].dropna()
+    sorted_groups = {k: np.sort(v.to_numpy(dtype=float))
+                     for k, v in data.groupby(group, observed=True, sort=True)[value]}
+    runs = {k: _value_runs(v) for k, v in sorted_groups.items()}
+    if pairs is None:
+        levels = list(sorted_groups)
+        pairs = [(levels[i], levels[j]) for i in range(len(levels)) for j in range(i + 1, len(levels))]
+
+    m = len(pairs)
+    n1, n2, u1, tie_term = (np.zeros(m) for _ in range(4))
+    for idx, (ga, gb) in enumerate(pairs):
+        a, b = sorted_groups[ga], sorted_groups[gb]
+        u1[idx] = (np.searchsorted(b, a, 'left') + np.searchsorted(b, a, 'right')).sum() / 2
+        # Serie w sumie grup: t = t_a + t_b dla wartości wspólnych, Σ (t³ - t)
+        (va, ta), (vb, tb) = runs[ga], runs[gb]
+        pos = np.minimum(np.searchsorted(vb, va), len(vb) - 1)
+        shared = np.where(vb[pos] == va, tb[pos], 0.0)
+        t = ta + shared
+        tie_term[idx] = (t ** 3 - t).sum() + (tb ** 3 - tb).sum() - (shared ** 3 - shared).sum()
+        n1[idx], n2[idx] = len(a), len(b)
+
+    z, p_value = _mann_whitney_z(u1, n1, n2, tie_term, alternative, use_continuity)
+
+    exact = np.flatnonzero((n1 < exact_threshold) & (n2 < exact_threshold)
+                           & (tie_term == 0) & (n1 > 0) & (n2 > 0))
+    for idx in exact:
+        ga, gb = pairs[idx]
+        p_value[idx] = stats.mannwhitneyu(sorted_groups[ga], sorted_groups[gb], method='exact',
+                                          alternative=_SCIPY_ALTERNATIVE[alternative]).pvalue
+
+    return pd.DataFrame({
+        'group1': [p[0] for p in pairs],
+        'group2': [p[1] for p in pairs],
+        'n1': n1.astype(int),
+        'n2': n2.astype(int),
+        'statistic': u1,
+        'z_statistic': z,
+        'p_value': p_value,
+        'method': np.where(np.isin(np.arange(m), exact), 'exact', 'asymptotic'),
+        'effect_size_r': z / np.sqrt(n1 + n2),
+        'rank_biserial': 2 * u1 / (n1 * n2) - 1,
+    })
+
+
+def wilcoxon_columns(x, y=None, mu0=0.0, alternative='two-sided', columns=None, exact_threshold=50):
+    """
+    Test Wilcoxona znakowanych rang dla wielu kolumn naraz (jedna próba lub pary x - y)
+
+    Różnice są rangowane raz dla wszystkich kolumn (`rank_columns`), zera
+    pomijane (metoda 'wilcox'), poprawka na remisy z długości serii.
+    Kolumny z co najwyżej `exact_threshold` niezerowymi różnicami bez
+    remisów liczone są dokładnie (scipy.stats.wilcoxon), małe kolumny
+    z remisami - testem permutacyjnym jak domyślnie w scipy, pozostałe -
+    przybliżeniem normalnym.
+
+    Parameters:
+    -----------
+    x : pd.DataFrame lub array-like
+        Dane (obserwacje × kolumny)
+    y : pd.DataFrame lub array-like, optional
+        Drugi pomiar dla testu par (te same wiersze i kolumny)
+    mu0 : float, dict lub pd.Series
+        Przesunięcie w hipotezie zerowej (mediana różnic)
+
+    Returns:
+    --------
+    pd.DataFrame : jeden wiersz na kolumnę - liczba niezerowych różnic,
+                   W+, z, p-value, r = Z / √n i korelacja rangowo-dwuseryjna
+    """
+    xv, columns = _as_float_matrix(x, columns)
+    diff = xv if y is None else xv - _as_float_matrix(y, columns)[0]
+    diff = diff - _per_column(mu0, columns)
+    w_plus, z, p_value, r, n_eff, tie_term = _signed_rank(diff, alternative)
+    method = _wilcoxon_small_sample(diff, p_value, n_eff, tie_term, alternative, exact_threshold)
+
+    total = n_eff * (n_eff + 1) / 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rank_biserial = (2 * w_plus - total) / total
+    return pd.DataFrame({
+        'n_nonzero': n_eff,
+        'statistic': w_plus,
+        'z_statistic': z,
+        'p_value': p_value,
+        'method': method,
+        'effect_size_r': r,
+        'rank_biserial': rank_biserial,
+    }, index=pd.Index(columns, name='column'))
+
+
+# === TESTY DLA PRÓB ZALEŻNYCH ===
+
+def _paired_table(diff, alternative, confidence_level, exact_threshold=50):
+    """
+    Test t dla par, Wilcoxon znakowanych rang i d_z dla macierzy różnic (obserwacje × porównania)
+
+    Braki danych w różnicy (brak jednego z pomiarów) są pomijane w danej kolumnie.
+    P-value Wilcoxona dla małych prób - jak w `wilcoxon_columns`.
+    """
+    n = (~np.isnan(diff)).sum(axis=0)
+    mean = np.nanmean(diff, axis=0)
+    std = np.nanstd(diff, axis=0, ddof=1)
+    se = std / np.sqrt(n)
+    alpha = 1 - confidence_level
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = mean / se
+        p_value = _p_value(t_stat, alternative, lambda t: stats.t.sf(t, n - 1), lambda t: stats.t.cdf(t, n - 1))
+        critical = stats.t.ppf(1 - alpha / 2, n - 1)
+
+        # d_z = średnia różnic / odchylenie różnic; SE z przybliżenia normalnego
+        d_z = mean / std
+        se_dz = np.sqrt(1 / n + d_z ** 2 / (2 * n))
+        z_critical = stats.norm.ppf(1 - alpha / 2)
+        hedges = 1 - 3 / (4 * (n - 1) - 1)
+
+    w_plus, z, w_p, r, n_eff, tie_term = _signed_rank(diff, alternative)
+    w_method = _wilcoxon_small_sample(diff, w_p, n_eff, tie_term, alternative, exact_threshold)
+    return {
+        'sample_size': n,
+        'mean_diff': mean,
+        'std_diff': std,
+        'standard_error': se,
+        't_statistic': t_stat,
+        'df': n - 1,
+        'p_value': p_value,
+        'ci_lower': mean - critical * se,
+        'ci_upper': mean + critical * se,
+        'cohens_dz': d_z,
+        'hedges_gz': d_z * hedges,
+        'dz_ci_lower': d_z - z_critical * se_dz,
+        'dz_ci_upper': d_z + z_critical * se_dz,
+        'wilcoxon_W': w_plus,
+        'wilcoxon_z': z,
+        'wilcoxon_p': w_p,
+        'wilcoxon_method': w_method,
+        'effect_size_r': r,
+    }
+
+
+def paired_comparisons(data, conditions=None, pairs=None, alternative='two-sided',
+                       confidence_level=0.95, exact_threshold=50):
+    """
+    Porównania par warunków dla danych w formacie szerokim (obiekty × warunki)
+
+    Macierz różnic dla wszystkich par warunków budowana jest jednym
+    indeksowaniem (X[:, i] - X[:, j]), a test t dla par, test Wilcoxona
+    znakowanych rang (jedno rangowanie wszystkich kolumn różnic) i d_z
+    Cohena liczone są redukcjami po osi obiektów.
+
+    Parameters:
+    -----------
+    data : pd.DataFrame lub array-like
+        Dane w formacie szerokim - wiersz to obiekt (np. wynik `to_wide`
+        lub `df.pivot`), kolumna to warunek
+    conditions : list, optional
+        Warunki (domyślnie wszystkie kolumny liczbowe)
+    pairs : list of tuple, optional
+        Pary (warunek1, warunek2) - domyślnie wszystkie pary; różnica
+        to warunek1 - warunek2
+    alternative : str
+        'two-sided', 'larger' (warunek1 > warunek2) lub 'smaller'
+    confidence_level : float
+        Poziom ufności przedziałów
+    exact_threshold : int
+        Największa liczba niezerowych różnic bez remisów dla dokładnego testu Wilcoxona
+
+    Returns:
+    --------
+    pd.DataFrame : jeden wiersz na parę - średnia różnic z przedziałem
+                   ufności, t, p, d_z (z przedziałem) i test Wilcoxona
+    """
+    values, conditions = _as_float_matrix(data, conditions)
+    position = {c: k for k, c in enumerate(conditions)}
+    if pairs is None:
+        pairs = [(conditions[i], conditions[j])
+                 for i in range(len(conditions)) for j in range(i + 1, len(conditions))]
+    first = np.array([position[a] for a, _ in pairs], dtype=int)
+    second = np.array([position[b] for _, b in pairs], dtype=int)
+
+    table = pd.DataFrame(_paired_table(values[:, first] - values[:, second],
+                                       alternative, confidence_level, exact_threshold))
+    table.insert(0, 'condition1', [a for a, _ in pairs])
+    table.insert(1, 'condition2', [b for _, b in pairs])
+    return table
+
+
+def paired_columns(before, after, columns=None, alternative='two-sided', confidence_level=0.95,
+                   exact_threshold=50):
+    """
+    Analiza przed / po dla wielu miar naraz (różnica = after - before)
+
+    Parameters:
+    -----------
+    before, after : pd.DataFrame lub array-like
+        Pomiary przed i po (te same obiekty w wierszach i te same kolumny)
+    columns : list, optional
+        Miary do porównania (domyślnie wszystkie kolumny liczbowe z before)
+
+    Returns:
+    --------
+    pd.DataFrame : jeden wiersz na miarę - kolumny jak w `paired_comparisons`
+    """
+    x, columns = _as_float_matrix(before, columns)
+    y, _ = _as_float_matrix(after, columns)
+    return pd.DataFrame(_paired_table(y - x, alternative, confidence_level, exact_threshold),
+                        index=pd.Index(columns, name='column'))
@@ -0,0 +1,218 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from funkcje_anova import oneway_anova
+from funkcje_opisowe import grouped_moments
+
+# === FUNKCJE POMOCNICZE ===
+
+def _sorted_groups(df, group, value):
+    """
+    Dane posortowane raz według (grupa, wartość) bez braków danych
+
+    Returns:
+    --------
+    tuple : (posortowana ramka, etykiety grup, indeksy początków grup)
+    """
+    data = df[[group, value]].dropna().sort_values([group, value], kind='mergesort')
+    codes, levels = pd.factorize(data[group], sort=True)
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    return data, levels, starts
+
+
+def _grouped_moments(data, group, value):
+    """
+    Liczność, średnia i momenty centralne m2, m3, m4 (obciążone) w grupach
+    """
+    m = grouped_moments(data, group, [value], quantiles=()).xs(value, level='column')
+    n = m['count']
+    return pd.DataFrame({'n': n.astype(int), 'mean': m['mean'],
+                         'm2': m['M2'] / n, 'm3': m['M3'] / n, 'm4': m['M4'] / n})
+
+
+def _dagostino(n, g1, b2):
+    """
+    Test K² D'Agostino-Pearsona z wektorów n, skośności g1 i kurtozy b2 (Pearsona)
+
+    Te same wzory co scipy.stats.skewtest / kurtosistest / normaltest,
+    ale dla wszystkich grup naraz. Dla n < 8 zwraca NaN.
+    """
+    n = np.asarray(n, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Test skośności
+        y = g1 * np.sqrt(((n + 1) * (n + 3)) / (6.0 * (n - 2)))
+        beta2 = (3.0 * (n ** 2 + 27 * n - 70) * (n + 1) * (n + 3)
+                 / ((n - 2.0) * (n + 5) * (n + 7) * (n + 9)))
+        w2 = -1 + np.sqrt(2 * (beta2 - 1))
+        delta = 1 / np.sqrt(0.5 * np.log(w2))
+        alpha = np.sqrt(2.0 / (w2 - 1))
+        y = np.where(y == 0, 1, y)
+        z_skew = delta * np.log(y / alpha + np.sqrt((y / alpha) ** 2 + 1))
+
+        # Test kurtozy
+        e = 3.0 * (n - 1) / (n + 1)
+        var_b2 = 24.0 * n * (n - 2) * (n - 3) / ((n + 1) ** 2 * (n + 3) * (n + 5))
+        x = (b2 - e) / np.sqrt(var_b2)
+        sqrt_beta1 = (6.0 * (n * n - 5 * n + 2) / ((n + 7) * (n + 9))
+                      * np.sqrt((6.0 * (n + 3) * (n + 5)) / (n * (n - 2) * (n - 3))))
+        a = 6.0 + 8.0 / sqrt_beta1 * (2.0 / sqrt_beta1 + np.sqrt(1 + 4.0 / sqrt_beta1 ** 2))
+        term1 = 1 - 2 / (9.0 * a)
+        denom = 1 + x * np.sqrt(2 / (a - 4.0))
+        term2 = np.sign(denom) * np.cbrt((1 - 2.0 / a) / np.abs(denom))
+        z_kurt = (term1 - term2) / np.sqrt(2 / (9.0 * a))
+
+    k2 = np.where(n >= 8, z_skew ** 2 + z_kurt ** 2, np.nan)
+    return k2, stats.chi2.sf(k2, 2)
+
+
+# === NORMALNOŚĆ ===
+
+def normality_by_group(df, group, value):
+    """
+    Testy normalności (Shapiro-Wilk i D'Agostino-Pearson) dla każdej grupy
+
+    Dane są sortowane raz; skośność, kurtoza i test D'Agostino liczone są
+    wektorowo z momentów grupowych, a test Shapiro-Wilka (który nie ma
+    postaci wektorowej) na gotowych wycinkach posortowanej tablicy.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dane w formacie długim
+    group : str
+        Kolumna z grupami
+    value : str
+        Kolumna z wartościami
+
+    Returns:
+    --------
+    pd.DataFrame : jeden wiersz na grupę - n, średnia, odchylenie, skośność,
+                   kurtoza (nadwyżkowa), W i p Shapiro-Wilka, K² i p D'Agostino
+    """
+    data, levels, starts = _sorted_groups(df, group, value)
+    m = _grouped_moments(data, group, value).reindex(levels)
+
+    g1 = m['m3'] / m['m2'] ** 1.5
+    b2 = m['m4'] / m['m2'] ** 2
+    k2, k2_p = _dagostino(m['n'].to_numpy(), g1.to_numpy(), b2.to_numpy())
+
+    values = data[value].to_numpy(dtype=float)
+    shapiro_w = np.full(len(levels), np.nan)
+    shapiro_p = np.full(len(levels), np.nan)
+    for idx, chunk in enumerate(np.split(values, starts[1:])):
+        if len(chunk) >= 3:
+            shapiro_w[idx], shapiro_p[idx] = stats.shapiro(chunk)
+
+    n = m['n'].to_numpy()
+    return pd.DataFrame({
+        'n': n,
+        'mean': m['mean'].to_numpy(),
+        'std': np.sqrt(m['m2'].to_numpy() * n / np.maximum(n - 1, 1)),
+        'skewness': g1.to_numpy(),
+        'kurtosis': b2.to_numpy() - 3,
+        'shapiro_W': shapiro_w,
+        'shapiro_p': shapiro_p,
+        'dagostino_K2': k2,
+        'dagostino_p': k2_p,
+    }, index=pd.Index(levels, name=group))
+
+
+# === JEDNORODNOŚĆ WARIANCJI ===
+
+def levene_test(df, group, value, center='mean'):
+    """
+    Test Levene'a (center='mean') lub Brown-Forsythe'a (center='median')
+
+    Odchylenia |x - środek grupy| wyznaczane są przez groupby().transform,
+    a statystyka to F jednoczynnikowej ANOVA na tych odchyleniach.
+
+    Returns:
+    --------
+    dict : statystyka F, stopnie swobody i p-value
+    """
+    if center not in ('mean', 'median'):
+        raise ValueError("center musi być 'mean' lub 'median'")
+    data = df[[group, value]].dropna()
+    centers = data.groupby(group, observed=True)[value].transform(center)
+    deviations = pd.DataFrame({group: data[group], 'abs_dev': (data[value] - centers).abs()})
+    row = oneway_anova(deviations, group, 'abs_dev').iloc[0]
+    return {
+        'test': 'levene' if center == 'mean' else 'brown-forsythe',
+        'statistic': row['F'],
+        'df_between': row['df_between'],
+        'df_within': row['df_within'],
+        'p_value': row['p_value'],
+    }
+
+
+# === WYKRESY KWANTYL-KWANTYL ===
+
+def qq_coordinates(df, group, value):
+    """
+    Współrzędne wykresów Q-Q (rozkład normalny) dla wszystkich grup naraz
+
+    Po jednym sortowaniu numer obserwacji w grupie daje `cumcount`,
+    a kwantyle teoretyczne liczone są wzorem Bloma (i - 3/8) / (n + 1/4).
+
+    Returns:
+    --------
+    pd.DataFrame : kolumny group, theoretical, sample, standardized
+                   (wartość standaryzowana średnią i odchyleniem grupy)
+    """
+    data, _, _ = _sorted_groups(df, group, value)
+    grouped = data.groupby(group, observed=True)[value]
+    i = grouped.cumcount().to_numpy() + 1
+    n = grouped.transform('size').to_numpy()
+    theoretical = stats.norm.ppf((i - 0.375) / (n + 0.25))
+    standardized = (data[value] - grouped.transform('mean')) / grouped.transform('std')
+    return pd.DataFrame({
+        group: data[group].to_numpy(),
+        'theoretical': theoretical,
+        'sample': data[value].to_numpy(),
+        'standardized': standardized.to_numpy(),
+    })
+
+
+def plot_qq_grid(df, group, value, ncols=3):
+    """
+    Rysuje wykresy Q-Q wszystkich grup z jednej tabeli `qq_coordinates`
+    """
+    import matplotlib.pyplot as plt
+
+    qq = qq_coordinates(df, group, value)
+    levels = qq[group].unique()
+    nrows = int(np.ceil(len(levels) / ncols))
+    fig, axes = plt.subplots(nrows, ncols, figsize=(4 * ncols, 3.5 * nrows), squeeze=False)
+    for ax, (level, part) in zip(axes.ravel(), qq.groupby(group, sort=False)):
+        ax.scatter(part['theoretical'], part['standardized'], s=15, alpha=0.7)
+        lim = np.nanmax(np.abs(part[['theoretical', 'standardized']].to_numpy()))
+        ax.plot([-lim, lim], [-lim, lim], color='red', linestyle='--')
+        ax.set_title(f'{group} = {level}')
+        ax.set_xlabel('Kwantyle teoretyczne')
+        ax.set_ylabel('Kwantyle z próby (stand.)')
+        ax.grid(True, alpha=0.3)
+    for ax in axes.ravel()[len(levels):]:
+        ax.axis('off')
+    plt.tight_layout()
+    plt.show()
+    return fig
+
+
+# === PODSUMOWANIE ZAŁOŻEŃ ANOVA ===
+
+def assumption_diagnostics(df, group, value):
+    """
+    Diagnostyka założeń ANOVA dla dowolnej liczby grup
+
+    Returns:
+    --------
+    dict : 'normality' - tabela z `normality_by_group`,
+           'homogeneity' - tabela z testami Levene'a i Brown-Forsythe'a
+    """
+    homogeneity = pd.DataFrame([levene_test(df, group, value, 'mean'),
+                                levene_test(df, group, value, 'median')]).set_index('test')
+    return {
+        'normality': normality_by_group(df, group, value),
+        'homogeneity': homogeneity,
+    }
@@ -1,13 +1,10 @@
 # Kurtoza IQR dla ataku (Attack) legendarnych pokemonów
 from scipy.stats import kurtosis
+from funkcje_opisowe import shape_measures
 legendary_attack = df_pokemon[df_pokemon['Legendary'] == True]['Attack']
 
-q1 = legendary_attack.quantile(0.25)
-q3 = legendary_attack.quantile(0.75)
-c10 = legendary_attack.quantile(0.10)
-c90 = legendary_attack.quantile(0.90)
-
-iqr_kurtoza = (q3 - q1) / (2 * (c90 - c10))
+# Kwartyle i decyle skrajne z jednego sortowania: (Q3 - Q1) / (2 * (P90 - P10))
+iqr_kurtoza = shape_measures(legendary_attack.to_frame()).loc['Attack', 'iqr_kurtosis']
 kurtoza = kurtosis(legendary_attack)
 print(f"Kurtoza klasyczna dla ataku legendarnych pokemonów: {kurtoza:.3f}")
 print(f"Kurtoza IQR dla ataku legendarnych pokemonów: {iqr_kurtoza:.3f}")
\ No newline at end of file
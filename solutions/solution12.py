@@ -1,6 +1,6 @@
-import pandas as pd
 from scipy import stats
-df = pd.read_csv("data/dailyActivity_merged.csv")
+from funkcje_dane import load_dataset
+df = load_dataset("dailyActivity_merged")
 steps = df['TotalSteps'].dropna()
 
 n = len(steps)
@@ -1,12 +1,11 @@
 import pandas as pd
-from statsmodels.stats.proportion import proportions_ztest, proportion_confint, proportion_effectsize
+from funkcje_dane import resolve_kaggle, stream_proportion
+from statsmodels.stats.proportion import proportion_confint, proportion_effectsize
 from statsmodels.stats.power import NormalIndPower
 
-import kagglehub
-
 # https://www.kaggle.com/datasets/stackoverflow/stack-overflow-2023-developers-survey
 
-path = kagglehub.dataset_download("stackoverflow/stack-overflow-2023-developers-survey")
+path = resolve_kaggle("stackoverflow/stack-overflow-2023-developers-survey")
 
 import os
 
@@ -14,36 +13,39 @@ for file in os.listdir(path):
     print(file)
 
 
-df = pd.read_csv(f"{path}/survey_results_public.csv")
-print(df.shape)
-print(df.columns[:20])
+survey_file = f"{path}/survey_results_public.csv"
 
+# Nagłówek wystarczy, żeby obejrzeć kolumny - nie wczytujemy całego pliku
+columns = pd.read_csv(survey_file, nrows=0).columns
+print(columns[:20])
 
-# Pokaż kolumny zawierające "AI" lub "artificial"
-[x for x in df.columns if "AI" in x or "artificial" in x.lower()]
 
-print(df["AISelect"].value_counts(dropna=False))
+# Pokaż kolumny zawierające "AI" lub "artificial"
+[x for x in columns if "AI" in x or "artificial" in x.lower()]
 
 positive = {
     "Yes, I use AI tools regularly",
     "Yes, I use AI tools sometimes"
 }
 
-ai_use = df["AISelect"].astype(str).isin(positive).astype(int)
+p0 = 0.60
+alpha = 0.05
 
+# Plik czytany porcjami, tylko kolumna AISelect; zliczamy sukcesy i n,
+# a test z dla proporcji liczony jest z samych liczności
+ai_use = stream_proportion(survey_file, "AISelect", positive, p0=p0, alternative='larger')
+print(ai_use["value_counts"])
 
-n = len(ai_use)
-count = ai_use.sum()
+n = ai_use["n"]
+count = ai_use["successes"]
 p_hat = count / n
-p0 = 0.60
-alpha = 0.05
 
 print(f"\nLiczba obserwacji: {n}")
 print(f"Liczba użytkowników AI: {count}")
 print(f"Oszacowana proporcja p̂ = {p_hat:.3f}")
 
 # --- 6. Test jednej proporcji ---
-stat, p_val = proportions_ztest(count, n, value=p0, alternative='larger')
+stat, p_val = ai_use["test"]["z_statistic"], ai_use["test"]["p_value"]
 ci_low, ci_high = proportion_confint(count, n, alpha=alpha, method="wilson")
 h = proportion_effectsize(p_hat, p0)
 
@@ -65,7 +67,7 @@ else:
     import matplotlib.pyplot as plt
 
 # 🔹 policz częstości odpowiedzi
-ai_counts = df["AISelect"].value_counts(dropna=False).sort_values(ascending=True)
+ai_counts = ai_use["value_counts"].sort_values(ascending=True)
 
 # 🔹 wykres słupkowy
 plt.figure(figsize=(8, 5))
@@ -5,16 +5,18 @@ sns.lineplot(data = df_melted, x = 'Year', y = 'Days Missed', hue = "Reason")
 # Wykorzystajmy `datetime`
 
 # Stwórzmy nową kolumnę o nazwie `date`, która łączy `Month` i `Year`.
-# Następnie możemy użyć `pd.to_datetime`, aby przekształcić ją w niestandardową reprezentację `pandas`.
+# Będzie to kolumna typu `datetime64` - reprezentacja dat w `pandas`, którą seaborn rysuje na osi czasu.
 
-# Najpierw połączmy każdy miesiąc i rok w jeden ciąg znaków
+# Zamiast sklejać miesiąc i rok w ciąg znaków dla każdego wiersza, budujemy daty wprost z liczb
 
-df_melted['date'] = df_melted.apply(lambda row: str(row['Month']) + '-' + str(row['Year']), axis = 1)
+from funkcje_czas import assemble_dates
+
+df_melted['date'] = assemble_dates(df_melted, year = 'Year', month = 'Month')
 df_melted.head(2)
 
 # Ponownie wykres:
 
-sns.lineplot(data = df_melted, x = "datetime", y = "Days Missed", hue = "Reason");
+sns.lineplot(data = df_melted, x = "date", y = "Days Missed", hue = "Reason");
 
 # Duzo lepiej!
 
@@ -1,12 +1,8 @@
 # Skośność IQR dla punktów za atak (Attack) dla kilku generacji pokemonów
+from funkcje_opisowe import shape_measures
 
-def iqr_skewness(series):
-    q1 = series.quantile(0.25)
-    med = series.median()
-    q3 = series.quantile(0.75)
-    return ((q3 - med) - (med - q1)) / (q3 - q1)
+# Kwartyle wszystkich generacji z jednego sortowania - bez pętli z .quantile() dla każdej grupy
+skew_iqr = shape_measures(df_pokemon, by='Generation', columns=['Attack']).droplevel('column')['bowley']
 
-for gen in sorted(df_pokemon['Generation'].unique()):
-    attack = df_pokemon[df_pokemon['Generation'] == gen]['Attack']
-    skew_iqr = iqr_skewness(attack)
-    print(f"Generacja {gen}: skośność IQR dla Attack = {skew_iqr:.3f}")
\ No newline at end of file
+for gen, value in skew_iqr.items():
+    print(f"Generacja {gen}: skośność IQR dla Attack = {value:.3f}")